@@ -247,13 +247,15 @@ IMPORTANT: After filling all input fields, you will be instructed to click on an
         field_descriptions = []
 
         # Log all field labels for debugging
-        logger.info("=" * 60)
-        logger.info("FIELDS DETECTED ON CURRENT PAGE:")
-        logger.info("=" * 60)
-        for idx, field in enumerate(input_fields, 1):
-            field_label = field.label or field.name or 'Unnamed'
-            logger.info(f"Field {idx}: Label='{field_label}' | ID='{field.element_id}' | Name='{field.name}' | Type='{field.field_type.value}'")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info("FIELDS DETECTED ON CURRENT PAGE:")
+            logger.info("=" * 60)
+            for idx, field in enumerate(input_fields, 1):
+                field_label = field.label or field.name or 'Unnamed'
+                logger.info("Field %s: Label='%s' | ID='%s' | Name='%s' | Type='%s'",
+                            idx, field_label, field.element_id, field.name, field.field_type.value)
+            logger.info("=" * 60)
 
         for field in input_fields:
             field_id = field.element_id
@@ -327,9 +329,9 @@ IMPORTANT: After filling all input fields, you will be instructed to click on an
 
             # Log the match for debugging
             if best_match_key:
-                logger.info(f"  ✓ Field '{field_label}' → Matched to data key '{best_match_key}' (score: {best_score})")
+                logger.info("  ✓ Field '%s' → Matched to data key '%s' (score: %s)", field_label, best_match_key, best_score)
             else:
-                logger.warning(f"  ⚠️  Field '{field_label}' → No match found in available data")
+                logger.warning("  ⚠️  Field '%s' → No match found in available data", field_label)
 
             # Build field description with label prominently displayed
             field_desc = (
@@ -364,12 +366,12 @@ IMPORTANT: After filling all input fields, you will be instructed to click on an
             field_descriptions.append(field_desc)
 
         # Log buttons detected
-        if next_buttons or final_submit_buttons:
+        if (next_buttons or final_submit_buttons) and logger.isEnabledFor(logging.INFO):
             logger.info("BUTTONS DETECTED:")
             for btn in next_buttons:
-                logger.info(f"  NEXT Button: Label='{btn.label or btn.name or 'Unnamed'}' | ID='{btn.element_id}'")
+                logger.info("  NEXT Button: Label='%s' | ID='%s'", btn.label or btn.name or 'Unnamed', btn.element_id)
             for btn in final_submit_buttons:
-                logger.info(f"  FINAL SUBMIT Button: Label='{btn.label or btn.name or 'Unnamed'}' | ID='{btn.element_id}'")
+                logger.info("  FINAL SUBMIT Button: Label='%s' | ID='%s'", btn.label or btn.name or 'Unnamed', btn.element_id)
             logger.info("-" * 60)
 
         # Build button descriptions - prioritize next buttons, then final submit
@@ -426,7 +428,7 @@ IMPORTANT: After filling all input fields, you will be instructed to click on an
             if len(value_str) > 80:
                 value_str = value_str[:80] + "..."
             data_summary.append(f"  - '{key}': {value_str}")
-            logger.info(f"  '{key}': {value_str}")
+            logger.info("  '%s': %s", key, value_str)
         logger.info("-" * 60)
 
         # Build instruction with current page context
@@ -68,12 +68,8 @@ class FormFillerAgent:
             api_key=self.openai_api_key,
         )
         
-        # Get tools
-        self.tools = get_screen_control_tools()
-        # Update base URL for all tools
-        for tool in self.tools:
-            if hasattr(tool, 'base_url'):
-                tool.base_url = api_base_url
+        # Get tools (shared instances for this base URL)
+        self.tools = get_screen_control_tools(self.api_base_url)
         
         # Create prompt template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -3,6 +3,10 @@ Async screen control tools that directly control mouse and keyboard using pyauto
 These tools work asynchronously and don't require HTTP API calls.
 """
 import asyncio
+import platform
+import queue
+import threading
+import time
 from typing import Optional
 import pyautogui
 
@@ -17,6 +21,109 @@ from pydantic import BaseModel, Field
 pyautogui.FAILSAFE = False
 pyautogui.PAUSE = 0.05  # Reduced pause for faster execution
 
+# Modifier for clipboard/tab shortcuts, resolved once instead of per call
+_MODIFIER_KEY = 'command' if platform.system() == 'Darwin' else 'ctrl'
+
+
+def _hotkey_fast(*keys: str) -> None:
+    """Press a key combination as raw down/up events without pyautogui's trailing PAUSE"""
+    for key in keys:
+        pyautogui.keyDown(key, _pause=False)
+    for key in reversed(keys):
+        pyautogui.keyUp(key, _pause=False)
+
+
+# All pyautogui calls run on one long-lived worker thread. Input events are
+# serialized by the OS anyway, so a single thread fed through a SimpleQueue
+# avoids default-executor growth and a concurrent.futures.Future per call;
+# results are handed back with loop.call_soon_threadsafe.
+_input_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+def _resolve(fut: asyncio.Future, result, error: Optional[BaseException]) -> None:
+    """Complete an asyncio future on its own loop (skipping cancelled awaits)"""
+    if fut.done():
+        return
+    if error is not None:
+        fut.set_exception(error)
+    else:
+        fut.set_result(result)
+
+
+def _input_worker() -> None:
+    """Drain queued (fn, args, future, loop) jobs forever"""
+    while True:
+        fn, args, fut, loop = _input_queue.get()
+        try:
+            result, error = fn(*args), None
+        except BaseException as e:
+            # Any per-job failure goes back to the caller; the worker keeps running
+            result, error = None, e
+        # The awaiting loop may have finished (asyncio.run returned) or the
+        # caller may have given up; there is nobody to hand the result to then
+        if loop.is_closed() or fut.done():
+            continue
+        try:
+            loop.call_soon_threadsafe(_resolve, fut, result, error)
+        except RuntimeError:
+            # Loop closed between the check and the call
+            pass
+
+
+threading.Thread(target=_input_worker, name="pyautogui-input", daemon=True).start()
+
+
+def _run_on_input_thread(fn, *args) -> asyncio.Future:
+    """Schedule fn(*args) on the input worker and return an awaitable future"""
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    _input_queue.put_nowait((fn, args, fut, loop))
+    return fut
+
+
+if platform.system() == 'Windows':
+    import ctypes
+    from ctypes import wintypes
+
+    _USER32 = ctypes.windll.user32
+    _USER32.WindowFromPoint.argtypes = [wintypes.POINT]
+    _USER32.WindowFromPoint.restype = wintypes.HWND
+    _USER32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    _USER32.GetAncestor.restype = wintypes.HWND
+    _USER32.GetForegroundWindow.restype = wintypes.HWND
+    _GA_ROOT = 2
+else:
+    _USER32 = None
+
+
+def _wait_focus(x: int, y: int, max_ms: int = 100) -> None:
+    """Wait until the window under (x, y) is the foreground window, bounded by max_ms"""
+    if _USER32 is None:
+        # No cheap focus query off Windows; keep the fixed settle delay
+        time.sleep(max_ms / 1000)
+        return
+    deadline = time.monotonic() + max_ms / 1000
+    while time.monotonic() < deadline:
+        hwnd = _USER32.WindowFromPoint(wintypes.POINT(x, y))
+        if hwnd and _USER32.GetAncestor(hwnd, _GA_ROOT) == _USER32.GetForegroundWindow():
+            return
+        time.sleep(0.002)
+
+
+# Screen dimensions rarely change mid-session; re-query at most every few seconds
+_SCREEN_SIZE_TTL = 5.0
+_screen_size_cache: Optional[tuple[float, tuple[int, int]]] = None
+
+
+def _screen_size() -> tuple[int, int]:
+    """Return pyautogui.size(), cached for _SCREEN_SIZE_TTL seconds"""
+    global _screen_size_cache
+    now = time.monotonic()
+    if _screen_size_cache is None or now - _screen_size_cache[0] > _SCREEN_SIZE_TTL:
+        width, height = pyautogui.size()
+        _screen_size_cache = (now, (width, height))
+    return _screen_size_cache[1]
+
 
 class MoveMouseInput(BaseModel):
     """Input for moving mouse"""
@@ -78,15 +185,16 @@ class MoveMouseTool(BaseTool):
     def _run(self, x: int, y: int, duration: float = 0.3) -> str:
         """Execute the tool synchronously"""
         try:
-            pyautogui.moveTo(x, y, duration=duration)
+            # Agents often re-issue a move to where the cursor already is
+            if pyautogui.position() != (x, y):
+                pyautogui.moveTo(x, y, duration=duration)
             return f"Mouse moved to ({x}, {y})"
         except Exception as e:
             return f"Error moving mouse: {str(e)}"
     
     async def _arun(self, x: int, y: int, duration: float = 0.1) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run, x, y, duration)
+        result = await _run_on_input_thread(self._run, x, y, duration)
         await asyncio.sleep(0.05)  # Reduced wait after moving mouse
         return result
 
@@ -113,8 +221,7 @@ class ClickMouseTool(BaseTool):
         # Triple click is disabled
         if clicks == 3:
             return "Triple click is disabled. Cannot perform triple click."
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run, x, y, button, clicks)
+        result = await _run_on_input_thread(self._run, x, y, button, clicks)
         await asyncio.sleep(0.1)  # Reduced wait after clicking
         return result
 
@@ -138,11 +245,10 @@ class TypeTextTool(BaseTool):
     
     async def _arun(self, text: str, interval: Optional[float] = None) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
         # Use default interval if None is provided
         if interval is None:
             interval = 0.05
-        result = await loop.run_in_executor(None, self._run, text, interval)
+        result = await _run_on_input_thread(self._run, text, interval)
         await asyncio.sleep(0.1)  # Reduced wait after typing
         return result
 
@@ -172,8 +278,7 @@ class PressKeyTool(BaseTool):
         keys_lower = keys.lower()
         if keys_lower in ['a', 'delete', 'del'] or 'ctrl+a' in keys_lower or 'ctrl+a' in keys_lower.replace(' ', ''):
             return f"Key '{keys}' is disabled. Cannot press this key."
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run, keys, presses)
+        result = await _run_on_input_thread(self._run, keys, presses)
         await asyncio.sleep(0.1)  # Reduced wait after pressing keys
         return result
 
@@ -184,25 +289,25 @@ class FillFieldTool(BaseTool):
     description = "Fill a form field by clicking on it and typing text. This tool handles the full sequence with delays. WAIT for it to complete before next action. Input: x, y coordinates (center of field), text to fill, and field type."
     args_schema = FillFieldInput
     
+    @staticmethod
+    def _fill(x: int, y: int, text: str) -> None:
+        """Click, wait for focus and type as a single batch on the input thread"""
+        # Focus is confirmed by _wait_focus, so skip the click's own PAUSE
+        pyautogui.click(x, y, button="left", clicks=1, _pause=False)
+        _wait_focus(x, y)
+        
+        # Clear existing text - DISABLED: Ctrl+A, delete, and triple click
+        # pyautogui.hotkey('ctrl', 'a')  # DISABLED - cannot use 'a' key
+        # pyautogui.press('delete')  # DISABLED - cannot use 'delete' key
+        # pyautogui.click(x, y, button="left", clicks=3)  # DISABLED - triple click not allowed
+        # Note: Field may still contain old text, new text will be appended
+        
+        pyautogui.write(text, interval=0.05)
+    
     def _run(self, x: int, y: int, text: str, field_type: str = "text") -> str:
         """Execute the tool synchronously"""
         try:
-            import time
-            # Click to focus the field
-            pyautogui.click(x, y, button="left", clicks=1)
-            time.sleep(0.1)  # Small delay for focus
-            
-            # Clear existing text - DISABLED: Ctrl+A, delete, and triple click
-            # pyautogui.hotkey('ctrl', 'a')  # DISABLED - cannot use 'a' key
-            # time.sleep(0.05)
-            # pyautogui.press('delete')  # DISABLED - cannot use 'delete' key
-            # time.sleep(0.05)
-            # pyautogui.click(x, y, button="left", clicks=3)  # DISABLED - triple click not allowed
-            # Note: Field may still contain old text, new text will be appended
-            
-            # Type new text
-            pyautogui.write(text, interval=0.05)
-            
+            self._fill(x, y, text)
             return f"Successfully filled {field_type} field at ({x}, {y}) with '{text}'"
         except Exception as e:
             return f"Error filling field: {str(e)}"
@@ -210,24 +315,8 @@ class FillFieldTool(BaseTool):
     async def _arun(self, x: int, y: int, text: str, field_type: str = "text") -> str:
         """Execute the tool asynchronously with sequential delays"""
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Step 1: Click to focus the field
-            # Use lambda to properly pass button and clicks as keyword arguments
-            await loop.run_in_executor(None, lambda: pyautogui.click(x, y, button="left", clicks=1))
-            await asyncio.sleep(0.1)  # Reduced wait for field to focus
-            
-            # Step 2: Clear existing text - DISABLED: Ctrl+A, delete, and triple click
-            # await loop.run_in_executor(None, pyautogui.hotkey, 'ctrl', 'a')  # DISABLED - cannot use 'a' key
-            # await asyncio.sleep(0.3)  # Wait after select all
-            # await loop.run_in_executor(None, pyautogui.press, 'delete')  # DISABLED - cannot use 'delete' key
-            # await asyncio.sleep(0.3)  # Wait after delete
-            # await loop.run_in_executor(None, pyautogui.click, x, y, "left", 3)  # DISABLED - triple click not allowed
-            # Note: Field may still contain old text, new text will be appended
-            
-            # Step 3: Type new text
-            # Use lambda to properly pass interval as keyword argument
-            await loop.run_in_executor(None, lambda: pyautogui.write(text, interval=0.05))
+            # Click, focus wait and typing go to the input thread as one job
+            await _run_on_input_thread(self._fill, x, y, text)
             await asyncio.sleep(0.1)  # Reduced wait after typing
             
             return f"Successfully filled {field_type} field at ({x}, {y}) with '{text}'"
@@ -243,7 +332,7 @@ class GetScreenInfoTool(BaseTool):
     def _run(self) -> str:
         """Execute the tool synchronously"""
         try:
-            width, height = pyautogui.size()
+            width, height = _screen_size()
             current_x, current_y = pyautogui.position()
             return f"Screen: {width}x{height}, Mouse: ({current_x}, {current_y})"
         except Exception as e:
@@ -251,8 +340,7 @@ class GetScreenInfoTool(BaseTool):
     
     async def _arun(self) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run)
+        result = await _run_on_input_thread(self._run)
         return result
 
 
@@ -272,8 +360,7 @@ class MoveMouseToFixedTool(BaseTool):
     
     async def _arun(self) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run)
+        result = await _run_on_input_thread(self._run)
         await asyncio.sleep(0.05)  # Small wait after moving
         return result
 
@@ -286,19 +373,14 @@ class CopyTool(BaseTool):
     def _run(self) -> str:
         """Execute the tool synchronously"""
         try:
-            import platform
-            if platform.system() == 'Darwin':  # Mac
-                pyautogui.hotkey('command', 'c')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'c')
+            _hotkey_fast(_MODIFIER_KEY, 'c')
             return "Text copied to clipboard"
         except Exception as e:
             return f"Error copying: {str(e)}"
     
     async def _arun(self) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run)
+        result = await _run_on_input_thread(self._run)
         await asyncio.sleep(0.1)  # Wait after copying
         return result
 
@@ -311,19 +393,14 @@ class TabTool(BaseTool):
     def _run(self) -> str:
         """Execute the tool synchronously"""
         try:
-            import platform
-            if platform.system() == 'Darwin':  # Mac
-                pyautogui.hotkey('command', 'tab')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'tab')
+            _hotkey_fast(_MODIFIER_KEY, 'tab')
             return "Command+Tab (Mac) or Ctrl+Tab (Windows/Linux) pressed"
         except Exception as e:
             return f"Error pressing tab: {str(e)}"
     
     async def _arun(self) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run)
+        result = await _run_on_input_thread(self._run)
         await asyncio.sleep(0.1)  # Wait after tabbing
         return result
 
@@ -336,19 +413,14 @@ class PasteTool(BaseTool):
     def _run(self) -> str:
         """Execute the tool synchronously"""
         try:
-            import platform
-            if platform.system() == 'Darwin':  # Mac
-                pyautogui.hotkey('command', 'v')
-            else:  # Windows/Linux
-                pyautogui.hotkey('ctrl', 'v')
+            _hotkey_fast(_MODIFIER_KEY, 'v')
             return "Text pasted from clipboard"
         except Exception as e:
             return f"Error pasting: {str(e)}"
     
     async def _arun(self) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run)
+        result = await _run_on_input_thread(self._run)
         await asyncio.sleep(0.2)  # Wait after pasting for content to be processed
         return result
 
@@ -431,8 +503,7 @@ class SelectDropdownOptionTool(BaseTool):
     
     async def _arun(self, x: int, y: int, options: list, target_value: str, dropdown_height: int = 30) -> str:
         """Execute the tool asynchronously"""
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, lambda: self._run(x, y, options, target_value, dropdown_height))
+        result = await _run_on_input_thread(lambda: self._run(x, y, options, target_value, dropdown_height))
         await asyncio.sleep(0.1)  # Additional wait after selection
         return result
 
@@ -1,8 +1,11 @@
 """
 LangChain tools for screen control API
 """
-import requests
-from typing import Optional, Dict, Any
+import asyncio
+import base64
+import httpx
+import orjson
+from typing import ClassVar, Optional, Dict, Any
 try:
     from langchain_core.tools import BaseTool
 except ImportError:
@@ -11,22 +14,93 @@ from pydantic import BaseModel, Field
 
 from app.schemas.form_fields import BoundingBox
 
+_DEFAULT_BASE_URL = "http://localhost:8000/screen-control"
+
+# HTTP/2 is negotiated when the API is served over TLS; against the plain
+# http:// local server the pool keeps persistent HTTP/1.1 connections. Idle
+# connections are kept for 60s so they survive the LLM's thinking time between
+# calls (run_server.sh matches this on the server side). Reads are unbounded
+# because typing long text with an interval can take a while.
+_CLIENT_OPTIONS: Dict[str, Any] = {
+    "http2": True,
+    "limits": httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60.0),
+    "timeout": httpx.Timeout(5.0, read=None),
+}
+
+# An AsyncClient is bound to the event loop it was created on, so keep one per
+# loop. close_async_client() closes a loop's client before the loop shuts down;
+# entries of loops closed without it can no longer be closed and are just
+# dropped on the next lookup so they don't pin those loops forever.
+_async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the AsyncClient for the running loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    for stale_loop in [stale_loop for stale_loop in _async_clients if stale_loop.is_closed()]:
+        del _async_clients[stale_loop]
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(**_CLIENT_OPTIONS)
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running loop's AsyncClient and its pooled connections, if any"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _center(x: int, y: int, width: int, height: int) -> tuple[int, int]:
+    """Center point of a field's bounding box"""
+    return x + width // 2, y + height // 2
+
+
+def _png_data_uri(png_bytes: bytes) -> str:
+    """Encode raw PNG bytes as the data URI callers of take_screenshot expect"""
+    return "data:image/png;base64," + base64.b64encode(png_bytes).decode("ascii")
+
 
 class ScreenControlToolBase(BaseTool):
     """Base class for screen control tools"""
-    base_url: str = "http://localhost:8000/screen-control"
-    
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    base_url: str = _DEFAULT_BASE_URL
+
+    # One pooled client shared by every tool subclass so keep-alive connections
+    # are reused across tool invocations (see _CLIENT_OPTIONS).
+    _client: ClassVar[httpx.Client] = httpx.Client(**_CLIENT_OPTIONS)
+
+    def _make_request(self, method: str, endpoint: str, json: Optional[Dict[str, Any]] = None,
+                      params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make HTTP request to screen control API"""
         url = f"{self.base_url}{endpoint}"
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, params=kwargs.get("params"))
-            else:
-                response = requests.request(method, url, json=kwargs.get("json"), params=kwargs.get("params"))
+            response = self._client.request(method, url, json=json, params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:  # orjson.JSONDecodeError is a ValueError
+            return {"error": str(e), "status": "failed"}
+
+    @staticmethod
+    def _check_bounds(x: int, y: int) -> Optional[str]:
+        """Reject coordinates outside the cached screen size without a round-trip"""
+        width, height = GetScreenInfoTool._cached_width, GetScreenInfoTool._cached_height
+        if width is None or height is None:
+            # Size not known yet; let the server validate
+            return None
+        if not (0 <= x < width and 0 <= y < height):
+            return f"Error: Coordinates ({x}, {y}) are out of bounds (screen is {width}x{height})"
+        return None
+
+    async def _amake_request(self, method: str, endpoint: str, json: Optional[Dict[str, Any]] = None,
+                             params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make HTTP request to screen control API without blocking the event loop"""
+        url = f"{self.base_url}{endpoint}"
+        try:
+            response = await _get_async_client().request(method, url, json=json, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError) as e:
             return {"error": str(e), "status": "failed"}
 
 
@@ -34,17 +108,46 @@ class GetScreenInfoTool(ScreenControlToolBase):
     """Tool to get screen information"""
     name = "get_screen_info"
     description = "Get screen dimensions and current mouse position. Returns width, height, current_x, current_y."
+    # Screen size rarely changes within a session: fetch /info once, then only poll the mouse
+    _cached_width: ClassVar[Optional[int]] = None
+    _cached_height: ClassVar[Optional[int]] = None
+    
+    @classmethod
+    def invalidate_screen_info(cls) -> None:
+        """Drop the cached screen size (e.g. after a resolution change)"""
+        cls._cached_width = None
+        cls._cached_height = None
+    
+    @classmethod
+    def _format(cls, result: Dict[str, Any]) -> str:
+        """Cache dimensions from an /info result and format the reply"""
+        if "width" in result:
+            cls._cached_width = result["width"]
+            cls._cached_height = result["height"]
+            x, y = result["current_x"], result["current_y"]
+        else:
+            x, y = result["x"], result["y"]
+        return f"Screen: {cls._cached_width}x{cls._cached_height}, Mouse: ({x}, {y})"
     
     def _run(self) -> str:
         """Execute the tool"""
-        result = self._make_request("GET", "/info")
+        if self._cached_width is None:
+            result = self._make_request("GET", "/info")
+        else:
+            result = self._make_request("GET", "/mouse/position")
         if "error" in result:
             return f"Error: {result['error']}"
-        return f"Screen: {result['width']}x{result['height']}, Mouse: ({result['current_x']}, {result['current_y']})"
+        return self._format(result)
     
     async def _arun(self) -> str:
         """Async execute"""
-        return self._run()
+        if self._cached_width is None:
+            result = await self._amake_request("GET", "/info")
+        else:
+            result = await self._amake_request("GET", "/mouse/position")
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return self._format(result)
 
 
 class MoveMouseTool(ScreenControlToolBase):
@@ -54,6 +157,9 @@ class MoveMouseTool(ScreenControlToolBase):
     
     def _run(self, x: int, y: int, duration: float = 0.5) -> str:
         """Execute the tool"""
+        out_of_bounds = self._check_bounds(x, y)
+        if out_of_bounds:
+            return out_of_bounds
         result = self._make_request("POST", "/mouse/move", json={"x": x, "y": y, "duration": duration})
         if "error" in result:
             return f"Error: {result['error']}"
@@ -61,7 +167,13 @@ class MoveMouseTool(ScreenControlToolBase):
     
     async def _arun(self, x: int, y: int, duration: float = 0.5) -> str:
         """Async execute"""
-        return self._run(x, y, duration)
+        out_of_bounds = self._check_bounds(x, y)
+        if out_of_bounds:
+            return out_of_bounds
+        result = await self._amake_request("POST", "/mouse/move", json={"x": x, "y": y, "duration": duration})
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return result.get("message", "Mouse moved successfully")
 
 
 class ClickMouseTool(ScreenControlToolBase):
@@ -71,6 +183,9 @@ class ClickMouseTool(ScreenControlToolBase):
     
     def _run(self, x: int, y: int, button: str = "left", clicks: int = 1) -> str:
         """Execute the tool"""
+        out_of_bounds = self._check_bounds(x, y)
+        if out_of_bounds:
+            return out_of_bounds
         result = self._make_request("POST", "/mouse/click", json={
             "x": x, "y": y, "button": button, "clicks": clicks
         })
@@ -80,7 +195,15 @@ class ClickMouseTool(ScreenControlToolBase):
     
     async def _arun(self, x: int, y: int, button: str = "left", clicks: int = 1) -> str:
         """Async execute"""
-        return self._run(x, y, button, clicks)
+        out_of_bounds = self._check_bounds(x, y)
+        if out_of_bounds:
+            return out_of_bounds
+        result = await self._amake_request("POST", "/mouse/click", json={
+            "x": x, "y": y, "button": button, "clicks": clicks
+        })
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return result.get("message", "Mouse clicked successfully")
 
 
 class TypeTextTool(ScreenControlToolBase):
@@ -100,7 +223,13 @@ class TypeTextTool(ScreenControlToolBase):
     
     async def _arun(self, text: str, interval: Optional[float] = None) -> str:
         """Async execute"""
-        return self._run(text, interval)
+        params = {"text": text}
+        if interval:
+            params["interval"] = interval
+        result = await self._amake_request("POST", "/keyboard/type", params=params)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return result.get("message", "Text typed successfully")
 
 
 class PressKeyTool(ScreenControlToolBase):
@@ -117,7 +246,10 @@ class PressKeyTool(ScreenControlToolBase):
     
     async def _arun(self, keys: str, presses: int = 1) -> str:
         """Async execute"""
-        return self._run(keys, presses)
+        result = await self._amake_request("POST", "/keyboard/press", json={"keys": keys, "presses": presses})
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return result.get("message", "Key pressed successfully")
 
 
 class ScrollTool(ScreenControlToolBase):
@@ -138,7 +270,14 @@ class ScrollTool(ScreenControlToolBase):
     
     async def _arun(self, clicks: int, x: Optional[int] = None, y: Optional[int] = None, horizontal: bool = False) -> str:
         """Async execute"""
-        return self._run(clicks, x, y, horizontal)
+        json_data = {"clicks": clicks, "horizontal": horizontal}
+        if x is not None and y is not None:
+            json_data["x"] = x
+            json_data["y"] = y
+        result = await self._amake_request("POST", "/mouse/scroll", json=json_data)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return result.get("message", "Scrolled successfully")
 
 
 class TakeScreenshotTool(ScreenControlToolBase):
@@ -148,17 +287,23 @@ class TakeScreenshotTool(ScreenControlToolBase):
     
     def _run(self, region: Optional[str] = None) -> str:
         """Execute the tool"""
-        params = {}
-        if region:
-            params["region"] = region
-        result = self._make_request("GET", "/screenshot/base64", params=params)
-        if "error" in result:
-            return f"Error: {result['error']}"
-        return result.get("image", "")
+        params = {"region": region} if region else {}
+        try:
+            response = self._client.get(f"{self.base_url}/screenshot/binary", params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return f"Error: {e}"
+        return _png_data_uri(response.content)
     
     async def _arun(self, region: Optional[str] = None) -> str:
         """Async execute"""
-        return self._run(region)
+        params = {"region": region} if region else {}
+        try:
+            response = await _get_async_client().get(f"{self.base_url}/screenshot/binary", params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return f"Error: {e}"
+        return _png_data_uri(response.content)
 
 
 class FillTextFieldTool(ScreenControlToolBase):
@@ -168,29 +313,29 @@ class FillTextFieldTool(ScreenControlToolBase):
     
     def _run(self, x: int, y: int, width: int, height: int, text: str) -> str:
         """Execute the tool"""
-        # Calculate center of field
-        center_x = x + width // 2
-        center_y = y + height // 2
+        center_x, center_y = _center(x, y, width, height)
         
-        # Click to focus
-        click_result = self._make_request("POST", "/mouse/click", json={"x": center_x, "y": center_y, "button": "left", "clicks": 1})
-        if "error" in click_result:
-            return f"Error clicking field: {click_result['error']}"
-        
-        # Clear existing text (select all and delete)
-        self._make_request("POST", "/keyboard/press", json={"keys": "ctrl+a", "presses": 1})
-        self._make_request("POST", "/keyboard/press", json={"keys": "delete", "presses": 1})
-        
-        # Type new text
-        type_result = self._make_request("POST", "/keyboard/type", params={"text": text})
-        if "error" in type_result:
-            return f"Error typing text: {type_result['error']}"
+        # Click and type in a single server-side macro
+        result = self._make_request("POST", "/form/fill_field", json={
+            "x": center_x, "y": center_y, "text": text
+        })
+        if "error" in result:
+            return f"Error filling field: {result['error']}"
         
         return f"Successfully filled text field at ({center_x}, {center_y}) with '{text}'"
     
     async def _arun(self, x: int, y: int, width: int, height: int, text: str) -> str:
         """Async execute"""
-        return self._run(x, y, width, height, text)
+        center_x, center_y = _center(x, y, width, height)
+        
+        # Click and type in a single server-side macro
+        result = await self._amake_request("POST", "/form/fill_field", json={
+            "x": center_x, "y": center_y, "text": text
+        })
+        if "error" in result:
+            return f"Error filling field: {result['error']}"
+        
+        return f"Successfully filled text field at ({center_x}, {center_y}) with '{text}'"
 
 
 class SelectDropdownOptionTool(ScreenControlToolBase):
@@ -200,41 +345,47 @@ class SelectDropdownOptionTool(ScreenControlToolBase):
     
     def _run(self, x: int, y: int, width: int, height: int, option: str) -> str:
         """Execute the tool"""
-        # Calculate center of field
-        center_x = x + width // 2
-        center_y = y + height // 2
+        center_x, center_y = _center(x, y, width, height)
         
-        # Click to open dropdown
-        click_result = self._make_request("POST", "/mouse/click", json={"x": center_x, "y": center_y, "button": "left", "clicks": 1})
-        if "error" in click_result:
-            return f"Error clicking dropdown: {click_result['error']}"
-        
-        # Type the option (for searchable dropdowns) or use arrow keys
-        # First try typing
-        type_result = self._make_request("POST", "/keyboard/type", params={"text": option})
-        if "error" not in type_result:
-            # Press enter to select
-            self._make_request("POST", "/keyboard/press", json={"keys": "enter", "presses": 1})
-            return f"Successfully selected '{option}' from dropdown at ({center_x}, {center_y})"
+        # Open, type the option (for searchable dropdowns) and press enter server-side
+        result = self._make_request("POST", "/form/select", json={"x": center_x, "y": center_y, "option": option})
+        if "error" in result:
+            return f"Error selecting '{option}' from dropdown: {result['error']}"
         
-        return f"Attempted to select '{option}' from dropdown at ({center_x}, {center_y})"
+        return f"Successfully selected '{option}' from dropdown at ({center_x}, {center_y})"
     
     async def _arun(self, x: int, y: int, width: int, height: int, option: str) -> str:
         """Async execute"""
-        return self._run(x, y, width, height, option)
-
-
-def get_screen_control_tools() -> list[BaseTool]:
-    """Get all screen control tools"""
-    return [
-        GetScreenInfoTool(),
-        MoveMouseTool(),
-        ClickMouseTool(),
-        TypeTextTool(),
-        PressKeyTool(),
-        ScrollTool(),
-        TakeScreenshotTool(),
-        FillTextFieldTool(),
-        SelectDropdownOptionTool(),
-    ]
+        center_x, center_y = _center(x, y, width, height)
+        
+        # Open, type the option (for searchable dropdowns) and press enter server-side
+        result = await self._amake_request("POST", "/form/select", json={"x": center_x, "y": center_y, "option": option})
+        if "error" in result:
+            return f"Error selecting '{option}' from dropdown: {result['error']}"
+        
+        return f"Successfully selected '{option}' from dropdown at ({center_x}, {center_y})"
+
+
+# Tool instances are cached per API base URL; building nine pydantic models on
+# every agent bootstrap is wasted work since the tools hold no other state.
+_TOOLS_BY_BASE_URL: Dict[str, list[BaseTool]] = {}
+
 
+def get_screen_control_tools(base_url: Optional[str] = None) -> list[BaseTool]:
+    """Get all screen control tools, optionally pointed at a different API base URL"""
+    base_url = base_url or _DEFAULT_BASE_URL
+    tools = _TOOLS_BY_BASE_URL.get(base_url)
+    if tools is None:
+        tools = [
+            GetScreenInfoTool(base_url=base_url),
+            MoveMouseTool(base_url=base_url),
+            ClickMouseTool(base_url=base_url),
+            TypeTextTool(base_url=base_url),
+            PressKeyTool(base_url=base_url),
+            ScrollTool(base_url=base_url),
+            TakeScreenshotTool(base_url=base_url),
+            FillTextFieldTool(base_url=base_url),
+            SelectDropdownOptionTool(base_url=base_url),
+        ]
+        _TOOLS_BY_BASE_URL[base_url] = tools
+    return list(tools)
@@ -1,14 +1,123 @@
+import asyncio
+import copy
+import inspect
+import itertools
+import logging
 import os
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Optional, Any
+from typing import AsyncIterator, Callable, Iterator, Optional, Any
 import firebase_admin
-from firebase_admin import credentials, firestore
-from google.cloud.firestore import Client, Query
+from google.api_core.exceptions import (
+    AlreadyExists, Aborted, DeadlineExceeded, InternalServerError, ServiceUnavailable
+)
+from google.api_core.retry import AsyncRetry, if_exception_type
+from firebase_admin import credentials
+from google.cloud.firestore import AsyncClient, Client, Query, async_transactional
+from google.cloud.firestore_v1.base_query import FieldFilter
 from .schemas.job_app import JobApplication
 
+logger = logging.getLogger(__name__)
+
+# Default service account credentials: databasecreds.json in the backend folder
+_DEFAULT_CRED_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "databasecreds.json")
+
+# Short-lived caches for job and user reads; the same application or applicant
+# is fetched repeatedly while its status is being rendered.
+_READ_CACHE_TTL = 30.0
+_READ_CACHE_SIZE = 2048
+
+# A small pool of Firestore clients shared by every DatabaseManager instance.
+# Each client owns its own gRPC channel, so striping calls across them keeps
+# concurrent RPCs from queueing behind one channel's stream limit. Roughly one
+# client per CPU is a sensible ceiling. The channels are bound to the event
+# loop they are created on, so each running loop gets its own pool, as
+# (clients, round-robin iterator), on first use. close_client_pool() closes a
+# loop's pool before the loop shuts down; pools of loops closed without it can
+# no longer be closed and are just dropped on the next lookup.
+_CLIENT_POOL_SIZE = int(os.getenv("FIRESTORE_CLIENT_POOL_SIZE", "4"))
+_CLIENT_POOLS: dict[asyncio.AbstractEventLoop, tuple[list[AsyncClient], Iterator[AsyncClient]]] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Sync Firestore client for snapshot listeners, which the async client lacks.
+# Created on the first watch and closed once the last watch is unsubscribed.
+_LISTENER_CLIENT: Optional[Client] = None
+_LISTENER_WATCHES = 0
+
+# Probes within this window of the last successful one are answered from memory
+_HEALTH_CHECK_TTL = 5.0
+
+# Pending queue counts are reused for a few seconds so polling loops don't
+# re-run the aggregation on every tick
+_PENDING_COUNT_TTL = 5.0
+
+# Sort directions for get_jobs_paginated; the category + date_posted composite
+# indexes for both are declared in firestore.indexes.json at the repo root
+_ORDER_DIRECTIONS = {"desc": Query.DESCENDING, "asc": Query.ASCENDING}
+
+# Optional JobApplication fields, so raw list rows keep the same keys as
+# JobApplication.model_dump() when an older document lacks them
+_JOB_OPTIONAL_DEFAULTS = {
+    name: field.default for name, field in JobApplication.model_fields.items() if not field.is_required()
+}
+
+# Exponential backoff with jitter for transient Firestore errors, applied to
+# idempotent writes and single-document reads. create() is not retried: a
+# retried create whose first attempt committed would report AlreadyExists.
+_RETRY = AsyncRetry(
+    initial=0.1,
+    maximum=2.0,
+    multiplier=2.0,
+    timeout=10.0,
+    predicate=if_exception_type(ServiceUnavailable, DeadlineExceeded, Aborted, InternalServerError),
+)
+
+
+async def close_client_pool():
+    """Close the Firestore clients and gRPC channels of the running loop's pool."""
+    pool = _CLIENT_POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    for client in pool[0]:
+        # On grpc.aio transports close() hands back the channel's close coroutine
+        result = client.close()
+        if inspect.isawaitable(result):
+            await result
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor does not name an existing job document."""
+
+
+class _ListenerHandle:
+    """Snapshot listener handle that releases the shared listener client on unsubscribe."""
+
+    def __init__(self, watch):
+        self._watch = watch
+
+    def unsubscribe(self):
+        """Stop the listener, closing the listener client if no other watch uses it."""
+        global _LISTENER_CLIENT, _LISTENER_WATCHES
+        if self._watch is None:
+            return
+        self._watch.unsubscribe()
+        self._watch = None
+        with _CLIENT_LOCK:
+            _LISTENER_WATCHES -= 1
+            if _LISTENER_WATCHES == 0 and _LISTENER_CLIENT is not None:
+                _LISTENER_CLIENT.close()
+                _LISTENER_CLIENT = None
+
+
 class DatabaseManager:
     """
     Simplified database manager for JobFinder application using Firestore.
+
+    All instances share one pool of Firestore clients per event loop, and each
+    access to `db` hands out the next client in the pool; methods read `db`
+    once and reuse that client for all of their RPCs. Prefer the module-level
+    `db` manager over creating new managers.
     """
 
     def __init__(self, credentials_path: Optional[str] = None):
@@ -19,88 +128,142 @@ class DatabaseManager:
             credentials_path: Path to Firebase service account credentials JSON file.
                              Defaults to the databasecreds.json in backend folder.
         """
-        self.db: Optional[Client] = None
-        self._initialize_firebase(credentials_path)
-
-    def _initialize_firebase(self, credentials_path: Optional[str] = None):
-        """Initialize Firebase Admin SDK and Firestore client with simplified logic."""
-        try:
-            # Check if Firebase is already initialized
+        self._read_cache: dict[str, tuple[float, JobApplication]] = {}
+        self._url_index: dict[str, str] = {}
+        self._user_cache: dict[str, tuple[float, dict]] = {}
+        self._count_cache: dict[Optional[str], tuple[float, int]] = {}
+        self._pending_count: Optional[tuple[float, int]] = None
+        self._last_healthy: Optional[float] = None
+        self._app = self._initialize_firebase(credentials_path)
+
+    @property
+    def db(self) -> AsyncClient:
+        """Next Firestore client from the running loop's pool (round-robin)."""
+        loop = asyncio.get_running_loop()
+        for stale_loop in [stale_loop for stale_loop in _CLIENT_POOLS if stale_loop.is_closed()]:
+            del _CLIENT_POOLS[stale_loop]
+        pool = _CLIENT_POOLS.get(loop)
+        if pool is None:
+            clients = self._create_clients()
+            pool = _CLIENT_POOLS[loop] = (clients, itertools.cycle(clients))
+        return next(pool[1])
+
+    def _initialize_firebase(self, credentials_path: Optional[str] = None) -> firebase_admin.App:
+        """Initialize the Firebase Admin SDK if needed and return its app."""
+        with _CLIENT_LOCK:
             try:
-                app = firebase_admin.get_app()
-            except ValueError:
+                # Check if Firebase is already initialized
+                try:
+                    return firebase_admin.get_app()
+                except ValueError:
+                    pass
+
                 # Firebase not initialized, so initialize it
                 # If no credentials path provided, use the default one in backend folder
-                if not credentials_path:
-                    # Get the directory where this file is located
-                    current_dir = os.path.dirname(os.path.abspath(__file__))
-                    # Go up one level to backend directory
-                    backend_dir = os.path.dirname(current_dir)
-                    credentials_path = os.path.join(backend_dir, "databasecreds.json")
+                credentials_path = credentials_path or _DEFAULT_CRED_PATH
 
-                print(f"Looking for credentials at: {credentials_path}")
+                logger.info("Looking for credentials at: %s", credentials_path)
 
                 if credentials_path and os.path.exists(credentials_path):
                     cred = credentials.Certificate(credentials_path)
-                    firebase_admin.initialize_app(cred)
-                else:
-                    raise FileNotFoundError(
-                        f"Credentials file not found at {credentials_path}. "
-                        f"Please ensure databasecreds.json exists in the backend folder."
-                    )
-
-            # Initialize Firestore client
-            self.db = firestore.client()
-            print("Firestore client initialized successfully!")
-
-        except Exception as e:
-            print(f"Error initializing Firebase: {e}")
-            raise
+                    return firebase_admin.initialize_app(cred)
+                raise FileNotFoundError(
+                    f"Credentials file not found at {credentials_path}. "
+                    f"Please ensure databasecreds.json exists in the backend folder."
+                )
+
+            except Exception:
+                logger.exception("Error initializing Firebase")
+                raise
+
+    def _create_clients(self) -> list[AsyncClient]:
+        """Create a Firestore client pool for the running event loop."""
+        # Async Firestore clients so RPCs don't block the event loop
+        google_credentials = self._app.credential.get_credential()
+        clients = [
+            AsyncClient(project=self._app.project_id, credentials=google_credentials)
+            for _ in range(max(1, _CLIENT_POOL_SIZE))
+        ]
+        logger.info("Firestore client pool initialized successfully! (%s clients)", len(clients))
+        return clients
+
+    def _get_cached_job(self, application_id: str) -> Optional[JobApplication]:
+        """Return a cached job application if it is still fresh."""
+        entry = self._read_cache.get(application_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _READ_CACHE_TTL:
+            self._evict_job(application_id)
+            return None
+        return entry[1].model_copy(deep=True)
+
+    def _evict_job(self, application_id: str) -> None:
+        """Remove a job from the read cache together with its URL index entry."""
+        entry = self._read_cache.pop(application_id, None)
+        if entry is not None and entry[1].job_url and self._url_index.get(entry[1].job_url) == application_id:
+            del self._url_index[entry[1].job_url]
+
+    def _cache_job(self, application: JobApplication) -> None:
+        """Store a job application read from Firestore in the read cache."""
+        self._evict_job(application.application_id)
+        if len(self._read_cache) >= _READ_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._evict_job(next(iter(self._read_cache)))
+        self._read_cache[application.application_id] = (time.monotonic(), application.model_copy(deep=True))
+        if application.job_url:
+            self._url_index[application.job_url] = application.application_id
+
+    def _invalidate_job(self, application_id: str, job_url: Optional[str] = None) -> None:
+        """Drop cached reads for a job application after it is written."""
+        self._evict_job(application_id)
+        if job_url:
+            self._url_index.pop(job_url, None)
+
+    def _get_cached_user(self, applicant_id: str) -> Optional[dict]:
+        """Return cached user data if it is still fresh."""
+        entry = self._user_cache.get(applicant_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > _READ_CACHE_TTL:
+            del self._user_cache[applicant_id]
+            return None
+        return copy.deepcopy(entry[1])
 
-    def _serialize_datetime(self, obj: Any) -> Any:
-        """Convert datetime objects to Firestore-compatible format."""
-        if isinstance(obj, datetime):
-            return obj
-        elif isinstance(obj, dict):
-            return {k: self._serialize_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize_datetime(item) for item in obj]
-        return obj
-
-    def _deserialize_datetime(self, obj: Any) -> Any:
-        """Convert Firestore timestamps back to datetime objects."""
-        if hasattr(obj, 'timestamp'):
-            # Firestore timestamp
-            return obj.timestamp()
-        elif isinstance(obj, dict):
-            return {k: self._deserialize_datetime(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deserialize_datetime(item) for item in obj]
-        return obj
+    def _cache_user(self, applicant_id: str, data: dict) -> None:
+        """Store user data read from Firestore in the read cache."""
+        self._user_cache.pop(applicant_id, None)
+        if len(self._user_cache) >= _READ_CACHE_SIZE:
+            del self._user_cache[next(iter(self._user_cache))]
+        self._user_cache[applicant_id] = (time.monotonic(), copy.deepcopy(data))
 
     # Job Application Operations
     async def create_job_application(self, application: JobApplication) -> bool:
         """
         Create a new job application record.
 
+        The write fails server-side if a record with the same ID already
+        exists, so callers don't need to read first to avoid overwriting.
+
         Args:
             application: JobApplication object to create
 
         Returns:
-            True if created successfully, False otherwise
+            True if created successfully, False otherwise (including if it already exists)
         """
         try:
-            # Convert Pydantic model to dictionary
+            # Convert Pydantic model to dictionary; Firestore stores datetimes natively
             data = application.model_dump()
 
-            # Serialize datetime objects
-            data = self._serialize_datetime(data)
-
-            self.db.collection('jobs').document(application.application_id).set(data)
-            print(f"Job application created: {application.application_id}")
+            await self.db.collection('jobs').document(application.application_id).create(data)
+            self._invalidate_job(application.application_id, application.job_url)
+            self._count_cache.clear()
+            logger.debug("Job application created: %s", application.application_id)
             return True
-        except Exception as e:
-            print(f"Error creating job application: {e}")
+        except AlreadyExists:
+            logger.info("Job application already exists: %s", application.application_id)
+            return False
+        except Exception:
+            logger.exception("Error creating job application")
             return False
 
     async def get_job_application(self, application_id: str) -> Optional[JobApplication]:
@@ -113,19 +276,58 @@ class DatabaseManager:
         Returns:
             JobApplication object if found, None otherwise
         """
+        cached = self._get_cached_job(application_id)
+        if cached is not None:
+            return cached
+
         try:
             doc_ref = self.db.collection('jobs').document(application_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get(retry=_RETRY)
 
             if doc.exists:
                 data = doc.to_dict()
-                data = self._deserialize_datetime(data)
-                return JobApplication(**data)
+                application = JobApplication(**data)
+                self._cache_job(application)
+                return application
             return None
-        except Exception as e:
-            print(f"Error getting job application: {e}")
+        except Exception:
+            logger.exception("Error getting job application")
             return None
 
+    async def get_job_applications(self, application_ids: list[str]) -> dict[str, JobApplication]:
+        """
+        Get several job applications by ID in a single batched read.
+
+        Args:
+            application_ids: IDs of the job applications
+
+        Returns:
+            Dictionary of found job applications keyed by ID; missing IDs are omitted
+        """
+        found: dict[str, JobApplication] = {}
+        missing = []
+        for application_id in dict.fromkeys(application_ids):
+            cached = self._get_cached_job(application_id)
+            if cached is not None:
+                found[application_id] = cached
+            else:
+                missing.append(application_id)
+        if not missing:
+            return found
+
+        try:
+            client = self.db
+            refs = [client.collection('jobs').document(application_id) for application_id in missing]
+            async for doc in client.get_all(refs):
+                if doc.exists:
+                    data = doc.to_dict()
+                    application = JobApplication(**data)
+                    self._cache_job(application)
+                    found[doc.id] = application
+        except Exception:
+            logger.exception("Error getting job applications")
+        return found
+
     async def get_job_by_url(self, job_url: str) -> Optional[JobApplication]:
         """
         Get a job application by job URL.
@@ -136,17 +338,25 @@ class DatabaseManager:
         Returns:
             JobApplication object if found, None otherwise
         """
+        application_id = self._url_index.get(job_url)
+        if application_id:
+            cached = self._get_cached_job(application_id)
+            if cached is not None and cached.job_url == job_url:
+                return cached
+
         try:
+            # Single-field index lookup (auto-indexed by Firestore); fetch the one hit directly
             query = self.db.collection('jobs').where('job_url', '==', job_url).limit(1)
-            docs = query.stream()
+            docs = await query.get(retry=_RETRY)
 
-            for doc in docs:
-                data = doc.to_dict()
-                data = self._deserialize_datetime(data)
-                return JobApplication(**data)
+            if docs:
+                data = docs[0].to_dict()
+                application = JobApplication(**data)
+                self._cache_job(application)
+                return application
             return None
-        except Exception as e:
-            print(f"Error getting job by URL: {e}")
+        except Exception:
+            logger.exception("Error getting job by URL")
             return None
 
     async def update_job_application(self, application_id: str, application: JobApplication) -> bool:
@@ -161,20 +371,75 @@ class DatabaseManager:
             True if updated successfully, False otherwise
         """
         try:
-            # Convert Pydantic model to dictionary
+            # Convert Pydantic model to dictionary; Firestore stores datetimes natively
             data = application.model_dump()
 
-            # Serialize datetime objects
-            data = self._serialize_datetime(data)
-
-            self.db.collection('jobs').document(application_id).set(data, merge=True)
-            print(f"Job application updated: {application_id}")
+            await self.db.collection('jobs').document(application_id).set(data, merge=True, retry=_RETRY)
+            self._invalidate_job(application_id, application.job_url)
+            logger.debug("Job application updated: %s", application_id)
             return True
-        except Exception as e:
-            print(f"Error updating job application: {e}")
+        except Exception:
+            logger.exception("Error updating job application")
             return False
 
-    async def get_jobs_paginated(self, limit: int = 10, offset: int = 0, order_by: str = "date_posted", order_direction: str = "desc", category: str = None) -> dict:
+    async def _stream_jobs(self, limit: int, offset: int, order_by: str, order_direction: str, category: Optional[str],
+                           cursor: Optional[str], fields: Optional[list[str]]) -> AsyncIterator[tuple[str, dict]]:
+        """Run the paginated jobs query and yield (document ID, job dict) pairs as they arrive."""
+        # Build the query; the cursor lookup goes over the same client
+        client = self.db
+        query = client.collection('jobs')
+
+        # Filter by category if provided
+        if category:
+            query = query.where('category', '==', category)
+
+        # Add ordering
+        direction = _ORDER_DIRECTIONS.get(order_direction) or _ORDER_DIRECTIONS.get(order_direction.lower(), Query.ASCENDING)
+        query = query.order_by(order_by, direction=direction)
+
+        # Project to the requested fields server-side to cut the payload;
+        # application_id is always kept so any row can serve as the next cursor
+        if fields:
+            if 'application_id' not in fields:
+                fields = ['application_id', *fields]
+            query = query.select(fields)
+
+        # Resume after the cursor document if given; Firestore otherwise reads
+        # and bills for every skipped document on offset pagination. Resolving
+        # the cursor costs one single-document read per page, independent of
+        # how deep the page is.
+        if cursor:
+            cursor_doc = await client.collection('jobs').document(cursor).get(retry=_RETRY)
+            if not cursor_doc.exists:
+                raise InvalidCursorError(f"Invalid cursor: {cursor}")
+            query = query.start_after(cursor_doc).limit(limit)
+        else:
+            query = query.offset(offset).limit(limit)
+
+        # Execute query. Documents were validated as JobApplication when written,
+        # so rows are emitted as-is rather than re-validated and dumped again
+        async for doc in query.stream():
+            data = doc.to_dict()
+            if fields:
+                yield doc.id, data
+            else:
+                yield doc.id, {**_JOB_OPTIONAL_DEFAULTS, **data}
+
+    async def iter_jobs(self, limit: int = 10, offset: int = 0, order_by: str = "date_posted", order_direction: str = "desc", category: str = None, cursor: Optional[str] = None, fields: Optional[list[str]] = None) -> AsyncIterator[dict]:
+        """
+        Yield one page of job applications as they arrive from Firestore.
+
+        Takes the same arguments as get_jobs_paginated, but yields each job dict
+        as soon as its document is received instead of building the page first.
+        No pagination metadata is computed. Errors propagate to the caller.
+
+        Yields:
+            Job application dictionaries
+        """
+        async for _, job in self._stream_jobs(limit, offset, order_by, order_direction, category, cursor, fields):
+            yield job
+
+    async def get_jobs_paginated(self, limit: int = 10, offset: int = 0, order_by: str = "date_posted", order_direction: str = "desc", category: str = None, cursor: Optional[str] = None, fields: Optional[list[str]] = None) -> dict:
         """
         Get job applications with pagination support.
 
@@ -184,57 +449,62 @@ class DatabaseManager:
             order_by: Field to order by (default: date_posted)
             order_direction: Order direction ("asc" or "desc", default: "desc")
             category: Optional category to filter by
+            cursor: Optional next_cursor from the previous page. When given, the
+                    page starts right after that document and `offset` is
+                    ignored; current_page and total_pages are then None since
+                    the page's position is unknown
+            fields: Optional list of fields to return per job. Firestore projects
+                    the documents server-side and the partial dicts are returned
+                    as-is; application_id is always included
 
         Returns:
             Dictionary containing jobs list and metadata
+
+        Raises:
+            InvalidCursorError: If cursor does not name an existing job
         """
         try:
-            # Build the query
-            query = self.db.collection('jobs')
-
-            # Filter by category if provided
-            if category:
-                query = query.where('category', '==', category)
-
-            # Add ordering
-            if order_direction.lower() == "desc":
-                query = query.order_by(order_by, direction=Query.DESCENDING)
-            else:
-                query = query.order_by(order_by, direction=Query.ASCENDING)
-
-            # Apply offset and limit
-            query = query.offset(offset).limit(limit)
-
-            # Execute query
-            docs = query.stream()
-
+            # Fetch one extra document to learn whether another page follows
+            # without relying on the (cached) total count
+            doc_ids = []
             jobs = []
-            for doc in docs:
-                data = doc.to_dict()
-                data = self._deserialize_datetime(data)
-                job_application = JobApplication(**data)
-                jobs.append(job_application.model_dump())
-
-            # Get total count for pagination metadata
-            total_query = self.db.collection('jobs')
-            if category:
-                total_query = total_query.where('category', '==', category)
-            total_docs = list(total_query.stream())
-            total_count = len(total_docs)
+            async for doc_id, job in self._stream_jobs(limit + 1, offset, order_by, order_direction, category, cursor, fields):
+                doc_ids.append(doc_id)
+                jobs.append(job)
+            has_next = len(jobs) > limit
+            jobs = jobs[:limit]
+            next_cursor = doc_ids[limit - 1] if has_next and limit > 0 else None
+
+            # Get total count for pagination metadata via a server-side count
+            # aggregation, cached briefly since it rarely moves between pages
+            cached_count = self._count_cache.get(category)
+            if cached_count is not None and time.monotonic() - cached_count[0] <= _READ_CACHE_TTL:
+                total_count = cached_count[1]
+            else:
+                total_query = self.db.collection('jobs')
+                if category:
+                    total_query = total_query.where('category', '==', category)
+                count_result = await total_query.count().get()
+                total_count = int(count_result[0][0].value)
+                self._count_cache[category] = (time.monotonic(), total_count)
 
             return {
                 "jobs": jobs,
                 "total_count": total_count,
-                "current_page": (offset // limit) + 1 if limit > 0 else 1,
-                "total_pages": (total_count + limit - 1) // limit if limit > 0 else 1,
-                "has_next": offset + limit < total_count,
-                "has_previous": offset > 0,
+                "current_page": None if cursor else ((offset // limit) + 1 if limit > 0 else 1),
+                "total_pages": None if cursor else ((total_count + limit - 1) // limit if limit > 0 else 1),
+                "has_next": next_cursor is not None,
+                "has_previous": bool(cursor) or offset > 0,
                 "limit": limit,
-                "offset": offset
+                "offset": offset,
+                "next_cursor": next_cursor
             }
 
+        except InvalidCursorError:
+            # A bad client cursor, not a database failure
+            raise
         except Exception as e:
-            print(f"Error fetching paginated jobs: {e}")
+            logger.exception("Error fetching paginated jobs")
             return {
                 "jobs": [],
                 "total_count": 0,
@@ -244,6 +514,7 @@ class DatabaseManager:
                 "has_previous": False,
                 "limit": limit,
                 "offset": offset,
+                "next_cursor": None,
                 "error": str(e)
             }
 
@@ -255,16 +526,17 @@ class DatabaseManager:
         Returns:
             True if connection is healthy, False otherwise
         """
-        try:
-            # Try to read from a test collection
-            test_ref = self.db.collection('_health_check').document('test')
-            test_ref.set({'timestamp': datetime.now(timezone.utc)})
+        if self._last_healthy is not None and time.monotonic() - self._last_healthy <= _HEALTH_CHECK_TTL:
+            return True
 
-            # Try to read it back
-            doc = test_ref.get()
-            return doc.exists
+        try:
+            # A read-only probe proves connectivity in one round-trip without
+            # spending write quota; failures raise
+            await self.db.collection('_health_check').document('probe').get(timeout=2.0)
+            self._last_healthy = time.monotonic()
+            return True
         except Exception as e:
-            print(f"Database health check failed: {e}")
+            logger.warning("Database health check failed: %s", e)
             return False
 
     # Queue Operations
@@ -282,17 +554,59 @@ class DatabaseManager:
                 .order_by('created_at', direction=Query.ASCENDING)
                 .limit(1)
             )
-            docs = list(query.stream())
+            docs = [doc async for doc in query.stream()]
 
             if docs:
                 doc = docs[0]
                 data = doc.to_dict()
                 data['_doc_id'] = doc.id
-                print(f"[Queue] Found oldest pending item: {doc.id}")
+                logger.debug("[Queue] Found oldest pending item: %s", doc.id)
                 return data
             return None
-        except Exception as e:
-            print(f"[Queue] Error getting oldest queue item: {e}")
+        except Exception:
+            logger.exception("[Queue] Error getting oldest queue item")
+            return None
+
+    async def claim_oldest_queue_item(self) -> Optional[dict]:
+        """
+        Atomically take the oldest pending queue item and mark it 'processing'.
+
+        The read and the status update run in one transaction, so two workers
+        can never claim the same item; Firestore retries the transaction on
+        contention.
+
+        Returns:
+            Dictionary with the claimed queue item data including document ID, or None if no pending items
+        """
+        client = self.db
+        query = (
+            client.collection('queue')
+            .where(filter=FieldFilter('status', '==', 'pending'))
+            .order_by('created_at', direction=Query.ASCENDING)
+            .limit(1)
+        )
+
+        @async_transactional
+        async def claim(transaction) -> Optional[dict]:
+            async for doc in query.stream(transaction=transaction):
+                transaction.update(doc.reference, {
+                    'status': 'processing',
+                    'updated_at': datetime.now(timezone.utc)
+                })
+                data = doc.to_dict()
+                data['status'] = 'processing'
+                data['_doc_id'] = doc.id
+                return data
+            return None
+
+        try:
+            data = await claim(client.transaction())
+            if data:
+                self._pending_count = None
+                logger.debug("[Queue] Claimed oldest pending item: %s", data['_doc_id'])
+            return data
+        except Exception:
+            logger.exception("[Queue] Error claiming oldest queue item")
             return None
 
     async def delete_queue_item(self, doc_id: str) -> bool:
@@ -306,11 +620,12 @@ class DatabaseManager:
             True if deleted successfully, False otherwise
         """
         try:
-            self.db.collection('queue').document(doc_id).delete()
-            print(f"[Queue] Deleted queue item: {doc_id}")
+            await self.db.collection('queue').document(doc_id).delete(retry=_RETRY)
+            self._pending_count = None
+            logger.debug("[Queue] Deleted queue item: %s", doc_id)
             return True
-        except Exception as e:
-            print(f"[Queue] Error deleting queue item {doc_id}: {e}")
+        except Exception:
+            logger.exception("[Queue] Error deleting queue item %s", doc_id)
             return False
 
     async def update_queue_item_status(self, doc_id: str, status: str, error: Optional[str] = None) -> bool:
@@ -333,11 +648,12 @@ class DatabaseManager:
             if error:
                 update_data['error'] = error
 
-            self.db.collection('queue').document(doc_id).update(update_data)
-            print(f"[Queue] Updated queue item {doc_id} status to: {status}")
+            await self.db.collection('queue').document(doc_id).update(update_data, retry=_RETRY)
+            self._pending_count = None
+            logger.debug("[Queue] Updated queue item %s status to: %s", doc_id, status)
             return True
-        except Exception as e:
-            print(f"[Queue] Error updating queue item {doc_id}: {e}")
+        except Exception:
+            logger.exception("[Queue] Error updating queue item %s", doc_id)
             return False
 
     async def get_pending_queue_items_count(self) -> int:
@@ -347,14 +663,48 @@ class DatabaseManager:
         Returns:
             Number of pending queue items
         """
+        if self._pending_count is not None and time.monotonic() - self._pending_count[0] <= _PENDING_COUNT_TTL:
+            return self._pending_count[1]
+
         try:
-            query = self.db.collection('queue').where('status', '==', 'pending')
-            docs = list(query.stream())
-            return len(docs)
-        except Exception as e:
-            print(f"[Queue] Error counting queue items: {e}")
+            # Server-side count aggregation instead of downloading every pending doc
+            query = self.db.collection('queue').where(filter=FieldFilter('status', '==', 'pending'))
+            result = await query.count().get()
+            count = int(result[0][0].value)
+            self._pending_count = (time.monotonic(), count)
+            return count
+        except Exception:
+            logger.exception("[Queue] Error counting queue items")
             return 0
 
+    def watch_pending_queue(self, on_change: Callable[[], None]):
+        """
+        Listen for changes to the set of pending queue items.
+
+        The async Firestore client has no snapshot listeners, so this uses a
+        shared sync client whose listener runs on a background thread.
+
+        Args:
+            on_change: Called from the listener thread whenever pending items
+                       are added, removed or modified
+
+        Returns:
+            The listener handle (call unsubscribe() to stop it), or None if the
+            listener could not be started
+        """
+        global _LISTENER_CLIENT, _LISTENER_WATCHES
+        try:
+            with _CLIENT_LOCK:
+                if _LISTENER_CLIENT is None:
+                    _LISTENER_CLIENT = Client(project=self._app.project_id, credentials=self._app.credential.get_credential())
+                query = _LISTENER_CLIENT.collection('queue').where(filter=FieldFilter('status', '==', 'pending'))
+                watch = query.on_snapshot(lambda docs, changes, read_time: on_change())
+                _LISTENER_WATCHES += 1
+            return _ListenerHandle(watch)
+        except Exception:
+            logger.exception("[Queue] Error starting pending queue listener")
+            return None
+
     async def get_user_data(self, applicant_id: str) -> Optional[dict]:
         """
         Get user data by applicant ID.
@@ -365,18 +715,58 @@ class DatabaseManager:
         Returns:
             Dictionary with user data, or None if not found
         """
+        cached = self._get_cached_user(applicant_id)
+        if cached is not None:
+            return cached
+
         try:
             doc_ref = self.db.collection('users').document(applicant_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get(retry=_RETRY)
 
             if doc.exists:
                 data = doc.to_dict()
-                print(f"[Queue] Found user data for: {applicant_id}")
+                self._cache_user(applicant_id, data)
+                logger.debug("[Queue] Found user data for: %s", applicant_id)
                 return data
-            print(f"[Queue] No user data found for: {applicant_id}")
+            logger.debug("[Queue] No user data found for: %s", applicant_id)
             return None
-        except Exception as e:
-            print(f"[Queue] Error getting user data: {e}")
+        except Exception:
+            logger.exception("[Queue] Error getting user data")
             return None
 
+    async def get_user_data_bulk(self, applicant_ids: list[str]) -> dict[str, dict]:
+        """
+        Get user data for several applicants in a single batched read.
+
+        Args:
+            applicant_ids: The users' IDs
+
+        Returns:
+            Dictionary of found user data keyed by applicant ID; missing IDs are omitted
+        """
+        requested = dict.fromkeys(applicant_ids)
+        users: dict[str, dict] = {}
+        missing = []
+        for applicant_id in requested:
+            cached = self._get_cached_user(applicant_id)
+            if cached is not None:
+                users[applicant_id] = cached
+            else:
+                missing.append(applicant_id)
+        if not missing:
+            return users
+
+        try:
+            client = self.db
+            refs = [client.collection('users').document(applicant_id) for applicant_id in missing]
+            async for doc in client.get_all(refs):
+                if doc.exists:
+                    data = doc.to_dict()
+                    self._cache_user(doc.id, data)
+                    users[doc.id] = data
+            logger.debug("[Queue] Found user data for %s/%s applicants", len(users), len(requested))
+        except Exception:
+            logger.exception("[Queue] Error getting user data")
+        return users
+
 db = DatabaseManager()
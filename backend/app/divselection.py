@@ -9,13 +9,23 @@ This module uses Playwright to:
 """
 
 import asyncio
+import atexit
+import copy
+import hashlib
+import itertools
+import json
+import re
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 
-from playwright.async_api import async_playwright, Page, Browser, ElementHandle
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
 class SubmissionStatus(Enum):
@@ -76,6 +86,14 @@ PENDING_KEYWORDS = [
     "uploading", "validating", "checking", "reviewing", "pending"
 ]
 
+# Lower-cased once here so keyword matching never lowers per element
+_SUCCESS_KEYWORDS_LC = tuple(k.lower() for k in SUCCESS_KEYWORDS)
+_ERROR_KEYWORDS_LC = tuple(k.lower() for k in ERROR_KEYWORDS)
+_PENDING_KEYWORDS_LC = tuple(k.lower() for k in PENDING_KEYWORDS)
+
+# Any of these in a URL indicator means the URL itself confirms submission
+_URL_CONFIRMATION_PATTERN = re.compile("success|submitted|confirmation")
+
 # Visual indicators (CSS classes and IDs)
 SUCCESS_INDICATORS = [
     "success", "alert-success", "message-success", "notification-success",
@@ -107,7 +125,7 @@ class FieldType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class FormField:
     """Represents a detected form field."""
     element_id: str
@@ -150,6 +168,57 @@ FIELD_KEYWORDS = {
     FieldType.BUTTON: ["button", "btn", "click", "action"],
 }
 
+# Precompiled (pattern, type) rules, checked in FIELD_KEYWORDS order
+_FIELD_RULES: tuple[tuple[re.Pattern, FieldType], ...] = tuple(
+    (re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE), field_type)
+    for field_type, keywords in FIELD_KEYWORDS.items()
+)
+_SUBMIT_PATTERN = next(pattern for pattern, field_type in _FIELD_RULES if field_type is FieldType.SUBMIT)
+
+# Input type attributes that map directly to a field type
+_INPUT_TYPE_MAPPING = {
+    "email": FieldType.EMAIL,
+    "tel": FieldType.PHONE,
+    "file": FieldType.FILE,
+    "url": FieldType.URL,
+    "date": FieldType.DATE,
+    "checkbox": FieldType.CHECKBOX,
+    "radio": FieldType.RADIO,
+    "password": FieldType.PASSWORD,
+    "submit": FieldType.SUBMIT,
+    "button": FieldType.BUTTON,
+}
+
+@lru_cache(maxsize=512)
+def _classify_cached(input_type: str, name: str, id_: str, placeholder: str, aria: str, cls: str) -> FieldType:
+    """Classify a field from its type and attribute strings (memoized on the tuple)."""
+    # First check input type
+    if input_type in _INPUT_TYPE_MAPPING:
+        return _INPUT_TYPE_MAPPING[input_type]
+
+    # Check attributes for keywords
+    searchable = " ".join([name, id_, placeholder, aria, cls])
+
+    for pattern, field_type in _FIELD_RULES:
+        if pattern.search(searchable):
+            return field_type
+
+    if input_type == "text":
+        return FieldType.TEXT
+
+    return FieldType.UNKNOWN
+
+
+@lru_cache(maxsize=512)
+def _classify_button_cached(searchable: str) -> FieldType:
+    """Classify a button from its combined attribute/text string (memoized)."""
+    # Check for submit-related keywords
+    if _SUBMIT_PATTERN.search(searchable):
+        return FieldType.SUBMIT
+    # Default to generic button
+    return FieldType.BUTTON
+
+
 # Keywords that indicate "next-like" buttons (multi-step navigation, not final submission)
 NEXT_BUTTON_KEYWORDS = ["review", "next", "continue", "proceed", "forward", "step", "page"]
 
@@ -176,25 +245,195 @@ HIGHLIGHT_COLORS = {
 }
 
 
+# Disambiguates auto-generated screenshot names taken in the same nanosecond tick
+_screenshot_counter = itertools.count()
+
+# (color, badge text) per field type, resolved once instead of per highlighted field
+_HIGHLIGHT_STYLES = {
+    field_type: (HIGHLIGHT_COLORS.get(field_type, HIGHLIGHT_COLORS[FieldType.UNKNOWN]), field_type.value.upper())
+    for field_type in FieldType
+}
+
+# Resource types field detection never needs. Stylesheets are kept because
+# they decide visibility and layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+async def _block_heavy_resources(route):
+    """Route handler that aborts requests for _BLOCKED_RESOURCE_TYPES."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Constant (never templated) so the browser can cache the compiled function;
+# overlay values are passed as structured arguments rather than spliced into source
+_HIGHLIGHT_JS = """
+(items) => {
+    const frag = document.createDocumentFragment();
+    for (const it of items) {
+        // Create highlight overlay
+        const overlay = document.createElement('div');
+        overlay.id = `highlight-overlay-${it.index}`;
+        overlay.dataset.divselHighlight = '';
+        overlay.style.cssText = `
+            position: absolute;
+            left: ${it.x}px;
+            top: ${it.y}px;
+            width: ${it.width}px;
+            height: ${it.height}px;
+            border: 3px solid ${it.color};
+            background-color: ${it.color}33;
+            pointer-events: none;
+            z-index: 10000;
+            box-sizing: border-box;
+        `;
+        frag.appendChild(overlay);
+
+        // Add label badge
+        const badge = document.createElement('div');
+        badge.dataset.divselHighlight = '';
+        badge.style.cssText = `
+            position: absolute;
+            left: ${it.x}px;
+            top: ${it.y - 25}px;
+            background-color: ${it.color};
+            color: #000;
+            padding: 2px 8px;
+            font-size: 12px;
+            font-weight: bold;
+            font-family: Arial, sans-serif;
+            border-radius: 3px;
+            z-index: 10001;
+            white-space: nowrap;
+        `;
+        badge.textContent = it.label;
+        frag.appendChild(badge);
+    }
+    document.body.appendChild(frag);
+}
+"""
+
+
+# One Playwright driver per event loop with one Chromium per headless mode.
+# DivSelector instances open cheap, isolated contexts on these instead of
+# launching their own browser. Keyed by loop because Playwright objects are
+# bound to the loop that created them. Entries of loops that were closed
+# without close_shared_browsers (e.g. asyncio.run around a single analysis)
+# are dropped on the next lookup so they don't pin those loops forever.
+_shared_browsers: dict = {}
+
+
+def _drop_closed_loop_browsers():
+    """Forget shared browser entries whose event loop has been closed."""
+    for loop in [loop for loop in _shared_browsers if loop.is_closed()]:
+        del _shared_browsers[loop]
+
+
+async def _get_browser(headless: bool) -> Browser:
+    """Return the shared browser for the running loop, launching it on first use."""
+    loop = asyncio.get_running_loop()
+    _drop_closed_loop_browsers()
+    entry = _shared_browsers.get(loop)
+    if entry is None:
+        entry = _shared_browsers[loop] = {"lock": asyncio.Lock(), "playwright": None, "browsers": {}}
+
+    async with entry["lock"]:
+        if entry["playwright"] is None:
+            entry["playwright"] = await async_playwright().start()
+        browser = entry["browsers"].get(headless)
+        if browser is None or not browser.is_connected():
+            browser = await entry["playwright"].chromium.launch(headless=headless)
+            entry["browsers"][headless] = browser
+    return browser
+
+
+async def start_shared_browser(headless: bool = True):
+    """Launch the shared browser for the running loop ahead of the first analysis."""
+    await _get_browser(headless)
+
+
+async def close_shared_browsers():
+    """Close the shared browsers and Playwright driver of the running event loop."""
+    entry = _shared_browsers.pop(asyncio.get_running_loop(), None)
+    if entry is None:
+        return
+    for browser in entry["browsers"].values():
+        await browser.close()
+    if entry["playwright"]:
+        await entry["playwright"].stop()
+
+
+# Event loop reused by the synchronous run_* wrappers. Keeping one loop alive
+# (instead of asyncio.run per call) also keeps that loop's shared browser warm
+# across calls; both are shut down at interpreter exit. A loop can only be
+# driven by one thread at a time, so calls from several threads take turns.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _close_sync_loop(loop: asyncio.AbstractEventLoop):
+    """Close the shared browsers of a run_* loop, then the loop itself."""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(close_shared_browsers())
+    finally:
+        loop.close()
+
+
+def _run(coro):
+    """Run a coroutine to completion on the persistent run_* event loop."""
+    global _sync_loop
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "The synchronous run_* wrappers cannot be called from a running event loop; "
+            "await the matching async function instead"
+        )
+
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop.is_closed():
+            _sync_loop = asyncio.new_event_loop()
+            atexit.register(_close_sync_loop, _sync_loop)
+        return _sync_loop.run_until_complete(coro)
+
+
 class DivSelector:
     """
     Analyzes web pages to find, highlight, and screenshot form fields.
     """
 
-    def __init__(self, headless: bool = True, screenshot_dir: str = "screenshots"):
+    def __init__(self, headless: bool = True, screenshot_dir: str = "screenshots",
+                 block_resources: Optional[bool] = None):
         """
         Initialize the DivSelector.
 
         Args:
             headless: Run browser in headless mode
             screenshot_dir: Directory to save screenshots
+            block_resources: Abort image, font and media requests. Defaults to
+                headless, so a visible browser still renders the full page.
         """
         self.headless = headless
+        self.block_resources = headless if block_resources is None else block_resources
         self.screenshot_dir = Path(screenshot_dir)
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Screenshot bytes are written to disk by a background task started in start()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self.detected_fields: list[FormField] = []
+        # Built alongside detected_fields so results need no extra passes
+        self._field_summary: Counter = Counter()
+        self._field_dicts: list[dict] = []
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -206,50 +445,109 @@ class DivSelector:
         await self.close()
 
     async def start(self):
-        """Start the browser."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.page = await self.browser.new_page()
+        """Open an isolated browser context and page on the shared browser."""
+        self.browser = await _get_browser(self.headless)
         # Set a reasonable viewport size
-        await self.page.set_viewport_size({"width": 1920, "height": 1080})
+        self.context = await self.browser.new_context(viewport={"width": 1920, "height": 1080})
+        if self.block_resources:
+            # On the context so popups and new tabs are filtered too
+            await self.context.route("**/*", _block_heavy_resources)
+        self.page = await self.context.new_page()
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._screenshot_writer())
 
     async def close(self):
-        """Close the browser and cleanup."""
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        """Close this selector's context. The shared browser stays running."""
+        if self._write_queue is not None:
+            # Make sure every queued screenshot has hit the disk
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            self._write_queue = None
+            self._writer_task = None
+        if self.context:
+            await self.context.close()
+            self.context = None
+
+    async def _screenshot_writer(self):
+        """Drain queued (path, bytes) screenshots to disk off the event loop."""
+        while True:
+            path, data = await self._write_queue.get()
+            try:
+                await asyncio.to_thread(path.write_bytes, data)
+            except OSError as e:
+                print(f"Warning: Could not write screenshot {path}: {e}")
+            finally:
+                self._write_queue.task_done()
 
-    async def navigate(self, url: str, wait_for_load: bool = True):
+    async def navigate(self, url: str, wait_for_load: bool = True, idle_ms: int = 0):
         """
         Navigate to a URL.
 
         Args:
             url: The URL to navigate to
-            wait_for_load: Wait for the page to fully load
+            wait_for_load: Wait (up to 5s) for form elements or buttons to be attached
+            idle_ms: If set, additionally wait up to this many milliseconds for
+                the network to go idle
         """
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        await self.page.goto(url, wait_until="networkidle" if wait_for_load else "domcontentloaded")
-        # Give dynamic content time to render
-        await asyncio.sleep(1)
+        await self.page.goto(url, wait_until="domcontentloaded")
+
+        if wait_for_load:
+            # Return as soon as form elements exist instead of waiting for networkidle
+            try:
+                await self.page.wait_for_selector("form, input, textarea, button", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
+
+        if idle_ms:
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=idle_ms)
+            except PlaywrightTimeoutError:
+                pass
 
-    async def load_html(self, html_content: str, base_url: str = "about:blank"):
+    async def load_html(self, html_content: Union[str, bytes], base_url: str = "about:blank"):
         """
         Load HTML content directly into the page.
 
+        For an http(s) base_url the markup is served as the response to the
+        navigation itself, so the real base_url is never fetched and bytes are
+        passed through without decoding.
+
         Args:
-            html_content: The HTML content to load
+            html_content: The HTML content to load (str, or UTF-8 encoded bytes)
             base_url: Base URL for resolving relative links (optional)
         """
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        await self.page.goto(base_url)
-        await self.page.set_content(html_content, wait_until="domcontentloaded")
-        # Give dynamic content time to render
-        await asyncio.sleep(1)
+        if base_url.startswith(("http://", "https://")):
+            body = html_content.encode("utf-8") if isinstance(html_content, str) else html_content
+
+            async def _serve_document(route):
+                if route.request.is_navigation_request() and route.request.frame == self.page.main_frame:
+                    await route.fulfill(body=body, content_type="text/html; charset=utf-8")
+                else:
+                    # Let other handlers (e.g. resource blocking) see subresources
+                    await route.fallback()
+
+            await self.page.route("**/*", _serve_document)
+            try:
+                await self.page.goto(base_url, wait_until="domcontentloaded")
+            finally:
+                await self.page.unroute("**/*", _serve_document)
+        else:
+            if isinstance(html_content, bytes):
+                html_content = html_content.decode("utf-8")
+            await self.page.goto(base_url)
+            await self.page.set_content(html_content, wait_until="domcontentloaded")
+
+        # Give dynamic content up to a second to settle; idle pages continue immediately
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=1000)
+        except PlaywrightTimeoutError:
+            pass
 
     def _classify_field_type(self, input_type: str, attributes: dict) -> FieldType:
         """
@@ -262,55 +560,30 @@ class DivSelector:
         Returns:
             The classified FieldType
         """
-        # First check input type
-        type_mapping = {
-            "email": FieldType.EMAIL,
-            "tel": FieldType.PHONE,
-            "file": FieldType.FILE,
-            "url": FieldType.URL,
-            "date": FieldType.DATE,
-            "checkbox": FieldType.CHECKBOX,
-            "radio": FieldType.RADIO,
-            "password": FieldType.PASSWORD,
-            "submit": FieldType.SUBMIT,
-            "button": FieldType.BUTTON,
-        }
+        # Decided by input type alone; skip the attribute lookups and cache hashing
+        if input_type in _INPUT_TYPE_MAPPING:
+            return _INPUT_TYPE_MAPPING[input_type]
 
-        if input_type in type_mapping:
-            return type_mapping[input_type]
-
-        # Check attributes for keywords
-        searchable = " ".join([
+        return _classify_cached(
+            input_type,
             attributes.get("name", ""),
             attributes.get("id", ""),
             attributes.get("placeholder", ""),
             attributes.get("aria-label", ""),
             attributes.get("class", ""),
-        ]).lower()
-
-        for field_type, keywords in FIELD_KEYWORDS.items():
-            if any(kw in searchable for kw in keywords):
-                return field_type
-
-        if input_type == "text":
-            return FieldType.TEXT
-
-        return FieldType.UNKNOWN
+        )
 
-    async def _classify_button_type(self, element: ElementHandle, attributes: dict) -> FieldType:
+    def _classify_button_type(self, button_text: str, attributes: dict) -> FieldType:
         """
         Classify a button element as either submit or generic button.
 
         Args:
-            element: The button element
+            button_text: The button's text content (or value for inputs)
             attributes: Dictionary of element attributes
 
         Returns:
             FieldType.SUBMIT or FieldType.BUTTON
         """
-        # Get button text content
-        button_text = await element.evaluate("el => el.textContent || el.value || ''")
-
         # Combine all searchable text
         searchable = " ".join([
             attributes.get("name", ""),
@@ -318,14 +591,9 @@ class DivSelector:
             attributes.get("class", ""),
             attributes.get("aria-label", ""),
             button_text,
-        ]).lower()
-
-        # Check for submit-related keywords
-        submit_keywords = FIELD_KEYWORDS[FieldType.SUBMIT]
-        if any(kw in searchable for kw in submit_keywords):
-            return FieldType.SUBMIT
-        # Default to generic button
-        return FieldType.BUTTON
+        ])
+
+        return _classify_button_cached(searchable)
     
     def _classify_button_intent(self, label: str, name: str, field_type: FieldType) -> tuple[bool, bool]:
         """
@@ -362,101 +630,14 @@ class DivSelector:
         
         return is_next, is_final
 
-    async def _get_element_attributes(self, element: ElementHandle) -> dict:
-        """Get relevant attributes from an element."""
-        return await element.evaluate("""
-            el => ({
-                id: el.id || '',
-                name: el.name || '',
-                type: el.type || '',
-                placeholder: el.placeholder || '',
-                required: el.required || false,
-                'aria-label': el.getAttribute('aria-label') || '',
-                class: el.className || '',
-                tagName: el.tagName.toLowerCase()
-            })
-        """)
-
-    async def _find_label_for_element(self, element: ElementHandle) -> str:
-        """Find the label text associated with an element."""
-        label = await element.evaluate("""
-            el => {
-                // Check for associated label via 'for' attribute
-                if (el.id) {
-                    const label = document.querySelector(`label[for="${el.id}"]`);
-                    if (label) return label.textContent.trim();
-                }
-                
-                // Check for parent label
-                const parentLabel = el.closest('label');
-                if (parentLabel) return parentLabel.textContent.trim();
-                
-                // Check for aria-label
-                const ariaLabel = el.getAttribute('aria-label');
-                if (ariaLabel) return ariaLabel;
-                
-                // Check for preceding sibling or parent text
-                const parent = el.parentElement;
-                if (parent) {
-                    const text = parent.textContent.trim();
-                    if (text.length < 100) return text;
-                }
-                
-                return '';
-            }
-        """)
-        return label or ""
-
-    async def _get_select_options(self, element: ElementHandle) -> list:
-        """
-        Extract options from a select/dropdown element.
-
-        Args:
-            element: The select element
-
-        Returns:
-            List of option dictionaries with value and text
-        """
-        options = await element.evaluate("""
-            el => {
-                const options = [];
-                
-                // Handle native <select> elements
-                if (el.tagName.toLowerCase() === 'select') {
-                    const optionElements = el.options || el.querySelectorAll('option');
-                    for (let i = 0; i < optionElements.length; i++) {
-                        const opt = optionElements[i];
-                        options.push({
-                            value: opt.value || '',
-                            text: opt.textContent.trim() || opt.text || '',
-                            selected: opt.selected || false,
-                            disabled: opt.disabled || false
-                        });
-                    }
-                }
-                
-                // Also check for child <option> elements (fallback)
-                if (options.length === 0) {
-                    const optionElements = el.querySelectorAll('option');
-                    for (const opt of optionElements) {
-                        options.push({
-                            value: opt.value || '',
-                            text: opt.textContent.trim() || '',
-                            selected: opt.selected || false,
-                            disabled: opt.disabled || false
-                        });
-                    }
-                }
-                
-                return options;
-            }
-        """)
-        return options or []
-
     async def find_fields(self) -> list[FormField]:
         """
         Find all relevant form fields on the current page.
 
+        Visibility, attributes, labels, bounding boxes and select options for
+        every candidate element are gathered in a single page.evaluate call;
+        Python only classifies the returned records.
+
         Returns:
             List of detected FormField objects
         """
@@ -464,6 +645,8 @@ class DivSelector:
             raise RuntimeError("Browser not started. Call start() first.")
 
         self.detected_fields = []
+        self._field_summary = Counter()
+        self._field_dicts = []
 
         # Selectors for common form elements
         selectors = [
@@ -476,92 +659,162 @@ class DivSelector:
             "input[type='button']",  # Button inputs
         ]
 
-        for selector in selectors:
-            elements = await self.page.query_selector_all(selector)
-
-            for i, element in enumerate(elements):
-                try:
-                    # Check if element is visible
-                    is_visible = await element.is_visible()
-                    if not is_visible:
-                        continue
-
-                    attrs = await self._get_element_attributes(element)
-
-                    # For buttons, prefer text content as label
-                    tag_name = attrs.get("tagName", "input")
-                    if tag_name == "button" or attrs.get("type") in ["submit", "button"]:
-                        button_text = await element.evaluate("el => el.textContent || el.value || ''")
-                        label = button_text.strip() or await self._find_label_for_element(element)
-                    else:
-                        label = await self._find_label_for_element(element)
-
-                    # Get bounding box for the element
-                    box = await element.bounding_box()
-                    if not box:
-                        continue
-
-                    # Determine field type
-                    tag_name = attrs.get("tagName", "input")
-                    input_type = attrs.get("type", "text")
-
-                    if tag_name == "textarea":
-                        field_type = FieldType.TEXTAREA
-                    elif tag_name == "select":
-                        field_type = FieldType.SELECT
-                    elif tag_name == "button":
-                        # For button elements, check text content and attributes for submit keywords
-                        field_type = await self._classify_button_type(element, attrs)
-                    elif input_type in ["submit", "button"]:
-                        # For input elements of type submit or button
-                        field_type = await self._classify_button_type(element, attrs)
-                    else:
-                        field_type = self._classify_field_type(input_type, attrs)
-
-                    # Create unique selector for the element
-                    element_id = attrs.get("id", "")
-                    element_name = attrs.get("name", "")
-
-                    if element_id:
-                        unique_selector = f"#{element_id}"
-                    elif element_name:
-                        unique_selector = f"{tag_name}[name='{element_name}']"
-                    else:
-                        unique_selector = f"{selector}:nth-of-type({i + 1})"
-
-                    # Classify button intent (next vs final submit)
-                    is_next_button, is_final_submit = self._classify_button_intent(label, element_name, field_type)
-
-                    # Extract options for select/dropdown elements
-                    options = []
-                    if field_type == FieldType.SELECT:
-                        options = await self._get_select_options(element)
-
-                    form_field = FormField(
-                        element_id=element_id or f"field_{i}",
-                        field_type=field_type,
-                        label=label,
-                        name=element_name,
-                        placeholder=attrs.get("placeholder", ""),
-                        required=attrs.get("required", False),
-                        selector=unique_selector,
-                        bounding_box={
-                            "x": box["x"]+5,
-                            "y": box["y"]+5,
-                            "width": box["width"]-10,
-                            "height": box["height"]-10
-                        },
-                        is_next_button=is_next_button,
-                        is_final_submit=is_final_submit,
-                        options=options
-                    )
-
-                    self.detected_fields.append(form_field)
-
-                except Exception as e:
-                    # Skip elements that can't be processed
-                    print(f"Warning: Could not process element: {e}")
-                    continue
+        records = await self.page.evaluate("""
+            (selectors) => {
+                // Index label[for] once instead of querying the document per element;
+                // keep the first label per id, as querySelector would
+                const forMap = new Map();
+                for (const l of document.querySelectorAll('label[for]')) {
+                    if (!forMap.has(l.htmlFor)) forMap.set(l.htmlFor, l);
+                }
+
+                const findLabel = (el) => {
+                    // Check for associated label via 'for' attribute
+                    if (el.id) {
+                        const label = forMap.get(el.id);
+                        if (label) return label.textContent.trim();
+                    }
+
+                    // Check for parent label
+                    const parentLabel = el.closest('label');
+                    if (parentLabel) return parentLabel.textContent.trim();
+
+                    // Check for aria-label
+                    const ariaLabel = el.getAttribute('aria-label');
+                    if (ariaLabel) return ariaLabel;
+
+                    // Check for preceding sibling or parent text
+                    const parent = el.parentElement;
+                    if (parent) {
+                        const text = parent.textContent.trim();
+                        if (text.length < 100) return text;
+                    }
+
+                    return '';
+                };
+
+                const selectOptions = (el) => {
+                    const options = [];
+                    for (const opt of (el.options || el.querySelectorAll('option'))) {
+                        options.push({
+                            value: opt.value || '',
+                            text: opt.textContent.trim() || opt.text || '',
+                            selected: opt.selected || false,
+                            disabled: opt.disabled || false
+                        });
+                    }
+                    return options;
+                };
+
+                const records = [];
+                // Selectors overlap (e.g. submit inputs match both input selectors);
+                // report each element once, under the first selector that matched it
+                const seen = new Set();
+                for (const selector of selectors) {
+                    document.querySelectorAll(selector).forEach((el, index) => {
+                        if (seen.has(el)) return;
+                        seen.add(el);
+                        try {
+                            // Same visibility rule as Playwright's is_visible()
+                            const rect = el.getBoundingClientRect();
+                            if (rect.width === 0 || rect.height === 0) return;
+                            if (window.getComputedStyle(el).visibility === 'hidden') return;
+
+                            const tagName = el.tagName.toLowerCase();
+                            const type = el.type || '';
+                            const isButton = tagName === 'button' || type === 'submit' || type === 'button';
+                            const buttonText = isButton ? (el.textContent || el.value || '') : '';
+
+                            records.push({
+                                selector: selector,
+                                index: index,
+                                attrs: {
+                                    id: el.id || '',
+                                    name: el.name || '',
+                                    type: type,
+                                    placeholder: el.placeholder || '',
+                                    required: el.required || false,
+                                    'aria-label': el.getAttribute('aria-label') || '',
+                                    class: typeof el.className === 'string' ? el.className : (el.getAttribute('class') || ''),
+                                    tagName: tagName
+                                },
+                                buttonText: buttonText,
+                                label: (isButton && buttonText.trim()) || findLabel(el),
+                                box: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+                                options: tagName === 'select' ? selectOptions(el) : []
+                            });
+                        } catch (e) {
+                            // Skip elements that can't be processed
+                        }
+                    });
+                }
+                return records;
+            }
+        """, selectors)
+
+        for record in records:
+            try:
+                attrs = record["attrs"]
+                selector = record["selector"]
+                i = record["index"]
+                label = record["label"] or ""
+                box = record["box"]
+
+                # Determine field type
+                tag_name = attrs.get("tagName", "input")
+                input_type = attrs.get("type", "text")
+
+                if tag_name == "textarea":
+                    field_type = FieldType.TEXTAREA
+                elif tag_name == "select":
+                    field_type = FieldType.SELECT
+                elif tag_name == "button" or input_type in ["submit", "button"]:
+                    # For buttons, check text content and attributes for submit keywords
+                    field_type = self._classify_button_type(record["buttonText"], attrs)
+                else:
+                    field_type = self._classify_field_type(input_type, attrs)
+
+                # Create unique selector for the element
+                element_id = attrs.get("id", "")
+                element_name = attrs.get("name", "")
+
+                if element_id:
+                    unique_selector = f"#{element_id}"
+                elif element_name:
+                    unique_selector = f"{tag_name}[name='{element_name}']"
+                else:
+                    unique_selector = f"{selector}:nth-of-type({i + 1})"
+
+                # Classify button intent (next vs final submit)
+                is_next_button, is_final_submit = self._classify_button_intent(label, element_name, field_type)
+
+                form_field = FormField(
+                    element_id=element_id or f"field_{i}",
+                    field_type=field_type,
+                    label=label,
+                    name=element_name,
+                    placeholder=attrs.get("placeholder", ""),
+                    required=attrs.get("required", False),
+                    selector=unique_selector,
+                    bounding_box={
+                        "x": box["x"]+5,
+                        "y": box["y"]+5,
+                        "width": box["width"]-10,
+                        "height": box["height"]-10
+                    },
+                    is_next_button=is_next_button,
+                    is_final_submit=is_final_submit,
+                    options=record["options"] if field_type == FieldType.SELECT else []
+                )
+
+                self.detected_fields.append(form_field)
+                self._field_summary[field_type] += 1
+                self._field_dicts.append(form_field.to_dict())
+
+            except Exception as e:
+                # Skip elements that can't be processed
+                print(f"Warning: Could not process element: {e}")
+                continue
 
         return self.detected_fields
 
@@ -581,78 +834,84 @@ class DivSelector:
             print("No fields to highlight.")
             return
 
-        # Inject highlighting styles and create overlay elements
-        for i, form_field in enumerate(fields):
-            color = HIGHLIGHT_COLORS.get(form_field.field_type, HIGHLIGHT_COLORS[FieldType.UNKNOWN])
-            box = form_field.bounding_box
+        payload = [
+            {
+                "index": i,
+                "x": f.bounding_box["x"],
+                "y": f.bounding_box["y"],
+                "width": f.bounding_box["width"],
+                "height": f.bounding_box["height"],
+                "color": _HIGHLIGHT_STYLES[f.field_type][0],
+                "label": _HIGHLIGHT_STYLES[f.field_type][1],
+            }
+            for i, f in enumerate(fields)
+            if f.bounding_box
+        ]
 
-            if not box:
-                continue
+        # Create every overlay and badge in one DOM pass
+        await self.page.evaluate(_HIGHLIGHT_JS, payload)
 
-            # Create highlight overlay
-            await self.page.evaluate(f"""
-                (() => {{
-                    const overlay = document.createElement('div');
-                    overlay.id = 'highlight-overlay-{i}';
-                    overlay.style.cssText = `
-                        position: absolute;
-                        left: {box['x']}px;
-                        top: {box['y']}px;
-                        width: {box['width']}px;
-                        height: {box['height']}px;
-                        border: 3px solid {color};
-                        background-color: {color}33;
-                        pointer-events: none;
-                        z-index: 10000;
-                        box-sizing: border-box;
-                    `;
-                    document.body.appendChild(overlay);
-                    
-                    // Add label badge
-                    const badge = document.createElement('div');
-                    badge.style.cssText = `
-                        position: absolute;
-                        left: {box['x']}px;
-                        top: {box['y'] - 25}px;
-                        background-color: {color};
-                        color: #000;
-                        padding: 2px 8px;
-                        font-size: 12px;
-                        font-weight: bold;
-                        font-family: Arial, sans-serif;
-                        border-radius: 3px;
-                        z-index: 10001;
-                        white-space: nowrap;
-                    `;
-                    badge.textContent = '{form_field.field_type.value.upper()}';
-                    document.body.appendChild(badge);
-                }})();
-            """)
-
-    async def take_screenshot(self, filename: Optional[str] = None, full_page: bool = True) -> str:
+    async def reset_highlights(self):
+        """
+        Remove highlight overlays and forget detected fields so the current
+        page can be analyzed again without reloading it.
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started. Call start() first.")
+
+        await self.page.evaluate("document.querySelectorAll('[data-divsel-highlight]').forEach(n => n.remove())")
+        self.detected_fields = []
+        self._field_summary = Counter()
+        self._field_dicts = []
+
+    async def take_screenshot(self, filename: Optional[str] = None, full_page: bool = False,
+                              quality: int = 80) -> str:
         """
         Take a screenshot of the current page.
 
         Args:
-            filename: Custom filename. Auto-generated if None.
-            full_page: Capture the full page or just the viewport.
+            filename: Custom filename. Auto-generated if None. A .jpg/.jpeg
+                extension saves a JPEG, anything else a PNG.
+            full_page: Capture the full page or just the viewport. Ignored (viewport
+                only) when all detected fields fit in the viewport.
+            quality: JPEG quality (0-100); unused for PNG
 
         Returns:
-            Path to the saved screenshot
+            Path to the screenshot. The file is written in the background and
+            is guaranteed to exist once close() returns.
         """
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"fields_screenshot_{timestamp}.png"
+            filename = f"fields_screenshot_{time.time_ns()}_{next(_screenshot_counter)}.png"
+
+        # A full-page capture re-lays out the whole page; skip it when every
+        # detected field already sits inside the viewport
+        if full_page and self.detected_fields:
+            viewport = self.page.viewport_size
+            max_y = max(
+                (f.bounding_box["y"] + f.bounding_box["height"] for f in self.detected_fields if f.bounding_box),
+                default=None,
+            )
+            if viewport and max_y is not None and max_y + 5 <= viewport["height"]:
+                full_page = False
 
         screenshot_path = self.screenshot_dir / filename
-        await self.page.screenshot(path=str(screenshot_path), full_page=full_page)
+        if screenshot_path.suffix.lower() in (".jpg", ".jpeg"):
+            image = await self.page.screenshot(full_page=full_page, type="jpeg", quality=quality)
+        else:
+            image = await self.page.screenshot(full_page=full_page)
+        if self._write_queue is not None:
+            # Hand the write to the background writer; close() waits for it
+            await self._write_queue.put((screenshot_path, image))
+        else:
+            # Write off the event loop so concurrent pages keep progressing
+            await asyncio.to_thread(screenshot_path.write_bytes, image)
 
         return str(screenshot_path)
 
-    async def analyze_application_page(self, url: str = None, html_content: str = None, base_url: str = "about:blank") -> dict:
+    async def analyze_application_page(self, url: str = None, html_content: Union[str, bytes] = None, base_url: str = "about:blank") -> dict:
         """
         Complete workflow: load content (URL or HTML), find fields, highlight, and screenshot.
 
@@ -687,7 +946,7 @@ class DivSelector:
         await self.highlight_fields(fields)
 
         print("Taking screenshot...")
-        screenshot_path = await self.take_screenshot()
+        screenshot_path = await self.take_screenshot(full_page=True)
         print(f"Screenshot saved to: {screenshot_path}")
 
 
@@ -695,7 +954,7 @@ class DivSelector:
             "source": source,
             "url": url,
             "html_length": len(html_content) if html_content else None,
-            "fields": [f.to_dict() for f in fields],
+            "fields": self._field_dicts,
             "field_count": len(fields),
             "screenshot_path": screenshot_path,
             "field_summary": self._get_field_summary(fields)
@@ -703,57 +962,116 @@ class DivSelector:
 
     def _get_field_summary(self, fields: list[FormField]) -> dict:
         """Generate a summary of field types found."""
-        summary = {}
-        for form_field in fields:
-            field_type = form_field.field_type.value
-            summary[field_type] = summary.get(field_type, 0) + 1
-        return summary
-
-    async def _extract_element_info(self, element: ElementHandle) -> Dict[str, Any]:
-        """Extract information from an element for submission analysis."""
-        return await element.evaluate("""
-            el => ({
-                text: el.textContent.trim(),
-                id: el.id || '',
-                className: el.className || '',
-                tagName: el.tagName.toLowerCase(),
-                innerHTML: el.innerHTML,
-                visible: el.offsetParent !== null,
-                boundingBox: {
-                    x: el.getBoundingClientRect().x,
-                    y: el.getBoundingClientRect().y,
-                    width: el.getBoundingClientRect().width,
-                    height: el.getBoundingClientRect().height
-                }
-            })
-        """)
+        # Count by enum member and read .value once per distinct type
+        counts = self._field_summary if fields is self.detected_fields else Counter(f.field_type for f in fields)
+        return {field_type.value: n for field_type, n in counts.items()}
 
-    async def _search_for_keywords(self, keywords: List[str], element_selectors: List[str]) -> List[Dict[str, Any]]:
-        """Search for specific keywords in page elements."""
-        found_elements = []
+    async def _scan_submission_elements(self, element_selectors: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Scan the page for submission status evidence in a single evaluate call.
 
-        for selector in element_selectors:
-            try:
-                elements = await self.page.query_selector_all(selector)
-                for element in elements:
-                    if not await element.is_visible():
-                        continue
+        Args:
+            element_selectors: Selectors whose visible matches are checked for keywords
 
-                    element_info = await self._extract_element_info(element)
-                    text_content = element_info['text'].lower()
+        Returns:
+            Dictionary with "success", "error" and "pending" keyword matches
+            (one entry per matching element, in document order) and
+            "visual_success" / "visual_error" matches for the CSS class indicators
+        """
+        return await self.page.evaluate("""
+            ({selectors, successKw, errorKw, pendingKw, successIndicators, errorIndicators}) => {
+                // Element info is computed once even if an element is also an indicator match
+                const infoCache = new Map();
+                const extractInfo = (el) => {
+                    let info = infoCache.get(el);
+                    if (info === undefined) {
+                        // Same visibility rule as Playwright's is_visible()
+                        const rect = el.getBoundingClientRect();
+                        const visible = rect.width > 0 && rect.height > 0
+                            && window.getComputedStyle(el).visibility !== 'hidden';
+                        // Keywords are matched against the full text in the browser; only
+                        // the 200-char snippet confirmation_text needs is returned, and
+                        // innerHTML is omitted to keep the payload small on large containers
+                        info = visible ? {
+                            fullText: el.textContent.trim(),
+                            id: el.id || '',
+                            className: typeof el.className === 'string' ? el.className : (el.getAttribute('class') || ''),
+                            tagName: el.tagName.toLowerCase(),
+                            visible: el.offsetParent !== null,
+                            boundingBox: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+                        } : null;
+                        infoCache.set(el, info);
+                    }
+                    return info;
+                };
 
-                    # Check if any keyword is found in the text
-                    matching_keywords = [kw for kw in keywords if kw.lower() in text_content]
-                    if matching_keywords:
-                        element_info['matching_keywords'] = matching_keywords
-                        element_info['selector'] = selector
-                        found_elements.append(element_info)
+                const toRecord = ({fullText, ...rest}) => ({text: fullText.slice(0, 200), ...rest});
 
-            except Exception as e:
-                # Continue if selector fails
-                continue
+                const queryAll = (selector) => {
+                    try {
+                        return document.querySelectorAll(selector);
+                    } catch (e) {
+                        // Fall back to the selectors that do parse
+                        return [];
+                    }
+                };
+
+                const result = {success: [], error: [], pending: [], visual_success: [], visual_error: []};
+                const keywordGroups = [
+                    [result.success, successKw],
+                    [result.error, errorKw],
+                    [result.pending, pendingKw]
+                ];
+
+                // Walk the union of the selectors once, so an element matched by
+                // several of them (e.g. div.alert) is scanned a single time
+                const validSelectors = selectors.filter(sel => {
+                    try { document.querySelector(sel); return true; } catch (e) { return false; }
+                });
+                for (const el of queryAll(validSelectors.join(','))) {
+                    const info = extractInfo(el);
+                    if (!info) continue;
+                    const text = info.fullText.toLowerCase();
+                    let record = null;
+                    for (const [out, keywords] of keywordGroups) {
+                        const matching = keywords.filter(kw => text.includes(kw));
+                        if (!matching.length) continue;
+                        if (!record) {
+                            record = toRecord(info);
+                            record.selector = validSelectors.find(sel => el.matches(sel));
+                        }
+                        out.push({...record, matching_keywords: matching});
+                    }
+                }
 
-        return found_elements
+                // Check for visual indicators in CSS classes, also in one query
+                const indicatorGroups = [
+                    [result.visual_success, successIndicators],
+                    [result.visual_error, errorIndicators]
+                ];
+                const allIndicators = [...successIndicators, ...errorIndicators];
+                for (const el of queryAll(allIndicators.map(ind => `.${ind}`).join(','))) {
+                    const info = extractInfo(el);
+                    if (!info) continue;
+                    for (const [out, indicators] of indicatorGroups) {
+                        for (const indicator of indicators) {
+                            if (el.classList.contains(indicator)) {
+                                out.push({...toRecord(info), indicator_type: 'css_class', indicator_value: indicator});
+                            }
+                        }
+                    }
+                }
+
+                return result;
+            }
+        """, {
+            "selectors": element_selectors,
+            "successKw": _SUCCESS_KEYWORDS_LC,
+            "errorKw": _ERROR_KEYWORDS_LC,
+            "pendingKw": _PENDING_KEYWORDS_LC,
+            "successIndicators": SUCCESS_INDICATORS,
+            "errorIndicators": ERROR_INDICATORS,
+        })
 
     async def _check_url_indicators(self) -> List[str]:
         """Check URL for submission success indicators."""
@@ -777,11 +1095,11 @@ class DivSelector:
         title_lower = title.lower()
         indicators = []
 
-        for keyword in SUCCESS_KEYWORDS:
+        for keyword in _SUCCESS_KEYWORDS_LC:
             if keyword in title_lower:
                 indicators.append(f"Page title contains '{keyword}': {title}")
 
-        for keyword in ERROR_KEYWORDS:
+        for keyword in _ERROR_KEYWORDS_LC:
             if keyword in title_lower:
                 indicators.append(f"Page title contains error '{keyword}': {title}")
 
@@ -818,47 +1136,23 @@ class DivSelector:
         title_indicators = await self._analyze_page_title()
         indicators.extend(title_indicators)
 
-        # Search for success keywords
-        success_elements = await self._search_for_keywords(SUCCESS_KEYWORDS, search_selectors)
-
-        # Search for error keywords
-        error_elements = await self._search_for_keywords(ERROR_KEYWORDS, search_selectors)
-
-        # Search for pending keywords
-        pending_elements = await self._search_for_keywords(PENDING_KEYWORDS, search_selectors)
-
-        # Check for visual indicators in CSS classes
-        visual_success = []
-        visual_error = []
-
-        for indicator in SUCCESS_INDICATORS:
-            elements = await self.page.query_selector_all(f".{indicator}")
-            for element in elements:
-                if await element.is_visible():
-                    info = await self._extract_element_info(element)
-                    info['indicator_type'] = 'css_class'
-                    info['indicator_value'] = indicator
-                    visual_success.append(info)
-
-        for indicator in ERROR_INDICATORS:
-            elements = await self.page.query_selector_all(f".{indicator}")
-            for element in elements:
-                if await element.is_visible():
-                    info = await self._extract_element_info(element)
-                    info['indicator_type'] = 'css_class'
-                    info['indicator_value'] = indicator
-                    visual_error.append(info)
-
-        success_elements.extend(visual_success)
-        error_elements.extend(visual_error)
+        # Search for success/error/pending keywords and CSS class indicators
+        scan = await self._scan_submission_elements(search_selectors)
+        success_elements = scan["success"] + scan["visual_success"]
+        error_elements = scan["error"] + scan["visual_error"]
+        pending_elements = scan["pending"]
 
         # Extract confirmation text from success elements
         if success_elements:
-            confirmation_text = " | ".join([elem['text'][:200] for elem in success_elements[:3] if elem['text']])
+            # Element text arrives already cut to a 200-char snippet
+            confirmation_text = " | ".join([elem['text'] for elem in success_elements[:3] if elem['text']])
 
         # Determine status and confidence
         status, confidence = self._determine_status(
-            success_elements, error_elements, pending_elements, url_indicators, title_indicators
+            n_success=len(success_elements),
+            n_error=len(error_elements),
+            n_pending=len(pending_elements),
+            url_indicators=url_indicators,
         )
 
         # Add specific indicators
@@ -870,8 +1164,8 @@ class DivSelector:
             indicators.append(f"Found {len(pending_elements)} pending elements")
 
         # Take screenshot for documentation
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_filename = f"submission_check_{timestamp}.png"
+        # Confirmation UI is almost always above the fold; a viewport JPEG is enough
+        screenshot_filename = f"submission_check_{time.time_ns()}_{next(_screenshot_counter)}.jpg"
         screenshot_path = await self.take_screenshot(screenshot_filename)
 
         return SubmissionResult(
@@ -885,14 +1179,13 @@ class DivSelector:
             url=self.page.url
         )
 
-    def _determine_status(self, success_elements: List[Dict], error_elements: List[Dict],
-                         pending_elements: List[Dict], url_indicators: List[str],
-                         title_indicators: List[str]) -> tuple[SubmissionStatus, float]:
-        """Determine submission status and confidence based on found elements."""
+    def _determine_status(self, *, n_success: int, n_error: int, n_pending: int,
+                          url_indicators: List[str]) -> tuple[SubmissionStatus, float]:
+        """Determine submission status and confidence based on found element counts."""
 
-        success_score = len(success_elements) * 2 + len(url_indicators) * 3
-        error_score = len(error_elements) * 2
-        pending_score = len(pending_elements) * 1
+        success_score = n_success * 2 + len(url_indicators) * 3
+        error_score = n_error * 2
+        pending_score = n_pending * 1
 
         # High confidence thresholds
         if success_score >= 4 and error_score == 0:
@@ -915,8 +1208,7 @@ class DivSelector:
             return SubmissionStatus.PENDING, min(0.6, 0.3 + pending_score * 0.1)
 
         # Check for confirmation patterns in URL
-        url_check = any('success' in indicator or 'submitted' in indicator or 'confirmation' in indicator
-                       for indicator in url_indicators)
+        url_check = _URL_CONFIRMATION_PATTERN.search("\x00".join(url_indicators)) is not None
         if url_check:
             return SubmissionStatus.CONFIRMATION, 0.75
 
@@ -960,7 +1252,68 @@ class DivSelector:
         }
 
 
-async def analyze_url(url: str, headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
+# How long an on-disk URL analysis stays valid
+_ANALYSIS_CACHE_TTL = 3600
+# Most cached analyses kept under screenshot_dir/cache; the oldest go first
+_ANALYSIS_CACHE_MAX_FILES = 256
+
+
+def _analysis_cache_path(url: str, headless: bool, screenshot_dir) -> Path:
+    """Path of the cached analysis for (url, headless) under screenshot_dir/cache."""
+    digest = hashlib.sha1(f"{int(headless)}:{url}".encode("utf-8")).hexdigest()
+    return Path(screenshot_dir) / "cache" / f"{digest}.json"
+
+
+@lru_cache(maxsize=128)
+def _load_cached_analysis(path: str, mtime_ns: int) -> dict:
+    """Parse a cache file; keyed by mtime so a rewritten file is read again."""
+    return json.loads(Path(path).read_text())
+
+
+def _read_cached_analysis(url: str, headless: bool, screenshot_dir) -> Optional[dict]:
+    """Return a fresh cached analysis for the URL, or None on miss/expiry."""
+    path = _analysis_cache_path(url, headless, screenshot_dir)
+    try:
+        stat = path.stat()
+        if time.time() - stat.st_mtime > _ANALYSIS_CACHE_TTL:
+            return None
+        result = copy.deepcopy(_load_cached_analysis(str(path), stat.st_mtime_ns))
+    except (OSError, ValueError):
+        return None
+    # The screenshot is part of the result; treat a deleted one as a miss
+    if not Path(result.get("screenshot_path", "")).exists():
+        return None
+    return result
+
+
+def _prune_analysis_cache(cache_dir: Path):
+    """Drop expired cache files, then the oldest ones beyond _ANALYSIS_CACHE_MAX_FILES."""
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    cutoff = time.time() - _ANALYSIS_CACHE_TTL
+    for index, (mtime, path) in enumerate(entries):
+        if index >= _ANALYSIS_CACHE_MAX_FILES or mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def _write_cached_analysis(url: str, headless: bool, screenshot_dir, result: dict):
+    """Persist an analysis result for later _read_cached_analysis calls."""
+    path = _analysis_cache_path(url, headless, screenshot_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result))
+        _prune_analysis_cache(path.parent)
+    except OSError as e:
+        print(f"Warning: Could not cache analysis for {url}: {e}")
+
+
+async def analyze_url(url: str, headless: bool = True, screenshot_dir: str = "screenshots",
+                      selector: Optional[DivSelector] = None, use_cache: bool = False) -> dict:
     """
     Convenience function to analyze a URL.
 
@@ -968,15 +1321,81 @@ async def analyze_url(url: str, headless: bool = True, screenshot_dir: str = "sc
         url: The application page URL
         headless: Run browser in headless mode
         screenshot_dir: Directory to save screenshots
+        selector: An already started DivSelector to reuse. If None, a new
+            DivSelector opens (and closes) its own context on the running
+            loop's shared browser for this call.
+        use_cache: Return a result cached on disk under screenshot_dir/cache
+            if it is less than an hour old, and cache fresh results there.
+            Off by default so callers serving live pages always re-analyze.
 
     Returns:
         Dictionary with analysis results
     """
-    async with DivSelector(headless=headless, screenshot_dir=screenshot_dir) as selector:
-        return await selector.analyze_application_page(url=url)
+    if selector is not None:
+        screenshot_dir = selector.screenshot_dir
+        headless = selector.headless
+
+    if use_cache:
+        cached = await asyncio.to_thread(_read_cached_analysis, url, headless, screenshot_dir)
+        if cached is not None:
+            return cached
+
+    if selector is not None:
+        result = await selector.analyze_application_page(url=url)
+    else:
+        async with DivSelector(headless=headless, screenshot_dir=screenshot_dir) as selector:
+            result = await selector.analyze_application_page(url=url)
+
+    if use_cache:
+        await asyncio.to_thread(_write_cached_analysis, url, headless, screenshot_dir, result)
+    return result
+
+
+async def analyze_urls(urls: list[str], concurrency: int = 4, headless: bool = True,
+                       screenshot_dir: str = "screenshots", use_cache: bool = False) -> list[dict]:
+    """
+    Analyze several URLs concurrently on one browser.
+
+    Each URL gets its own DivSelector, i.e. its own isolated context on the
+    shared Chromium instance, and a semaphore keeps at most `concurrency`
+    of them open at once. With use_cache, fresh on-disk results (see
+    analyze_url) are returned without opening a context.
+
+    Args:
+        urls: The application page URLs
+        concurrency: Maximum number of pages analyzed at the same time
+        headless: Run browser in headless mode
+        screenshot_dir: Directory to save screenshots
+        use_cache: Read and write the on-disk analysis cache (see analyze_url)
+
+    Returns:
+        List of analysis results in the same order as urls. A URL that fails
+        yields {"url": url, "error": message} instead of aborting the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _worker(url: str) -> dict:
+        if use_cache:
+            cached = await asyncio.to_thread(_read_cached_analysis, url, headless, screenshot_dir)
+            if cached is not None:
+                return cached
+
+        async with semaphore:
+            async with DivSelector(headless=headless, screenshot_dir=screenshot_dir) as selector:
+                result = await selector.analyze_application_page(url=url)
+        if use_cache:
+            await asyncio.to_thread(_write_cached_analysis, url, headless, screenshot_dir, result)
+        return result
+
+    results = await asyncio.gather(*[_worker(url) for url in urls], return_exceptions=True)
+
+    return [
+        {"url": url, "error": str(result)} if isinstance(result, Exception) else result
+        for url, result in zip(urls, results)
+    ]
 
 
-async def analyze_html(html_content: str, base_url: str = "about:blank", headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
+async def analyze_html(html_content: Union[str, bytes], base_url: str = "about:blank", headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
     """
     Convenience function to analyze HTML content.
 
@@ -995,7 +1414,8 @@ async def analyze_html(html_content: str, base_url: str = "about:blank", headles
 
 def run_analysis(url: str, headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
     """
-    Synchronous wrapper for analyze_url.
+    Synchronous wrapper for analyze_url, with the on-disk analysis cache
+    enabled since CLI runs commonly revisit the same URLs.
 
     Args:
         url: The application page URL
@@ -1005,10 +1425,10 @@ def run_analysis(url: str, headless: bool = True, screenshot_dir: str = "screens
     Returns:
         Dictionary with analysis results
     """
-    return asyncio.run(analyze_url(url, headless, screenshot_dir))
+    return _run(analyze_url(url, headless, screenshot_dir, use_cache=True))
 
 
-def run_html_analysis(html_content: str, base_url: str = "about:blank", headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
+def run_html_analysis(html_content: Union[str, bytes], base_url: str = "about:blank", headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
     """
     Synchronous wrapper for analyze_html.
 
@@ -1021,7 +1441,7 @@ def run_html_analysis(html_content: str, base_url: str = "about:blank", headless
     Returns:
         Dictionary with analysis results
     """
-    return asyncio.run(analyze_html(html_content, base_url, headless, screenshot_dir))
+    return _run(analyze_html(html_content, base_url, headless, screenshot_dir))
 
 
 async def check_submission_status(url: str, headless: bool = True, screenshot_dir: str = "screenshots") -> dict:
@@ -1070,7 +1490,7 @@ def run_submission_check(url: str, headless: bool = True, screenshot_dir: str =
     Returns:
         Dictionary with submission status analysis results
     """
-    return asyncio.run(check_submission_status(url, headless, screenshot_dir))
+    return _run(check_submission_status(url, headless, screenshot_dir))
 
 
 def run_html_submission_check(html_content: str, base_url: str = "about:blank",
@@ -1087,7 +1507,7 @@ def run_html_submission_check(html_content: str, base_url: str = "about:blank",
     Returns:
         Dictionary with submission status analysis results
     """
-    return asyncio.run(check_html_submission_status(html_content, base_url, headless, screenshot_dir))
+    return _run(check_html_submission_status(html_content, base_url, headless, screenshot_dir))
 
 
 # Example usage and CLI
@@ -1096,7 +1516,7 @@ if __name__ == "__main__":
 
     if len(sys.argv) < 2:
         print("Usage:")
-        print("  URL analysis:  python divselection.py <url>")
+        print("  URL analysis:  python divselection.py <url> [<url> ...]")
         print("  HTML analysis: python divselection.py --html <html_file_path>")
         print("Examples:")
         print("  python divselection.py https://jobs.example.com/apply")
@@ -1118,15 +1538,16 @@ if __name__ == "__main__":
 
             html_file_path = sys.argv[html_file_index]
 
-            with open(html_file_path, 'r', encoding='utf-8') as f:
+            # Read raw bytes; load_html hands them to the browser without decoding
+            with open(html_file_path, 'rb') as f:
                 html_content = f.read()
 
             print(f"Analyzing HTML file: {html_file_path}")
-            print(f"HTML content length: {len(html_content)} characters")
+            print(f"HTML content length: {len(html_content)} bytes")
             print(f"Headless mode: {headless_mode}")
             print("-" * 50)
 
-            result = run_html_analysis(html_content, headless=headless_mode)
+            results = [run_html_analysis(html_content, headless=headless_mode)]
 
         except FileNotFoundError:
             print(f"Error: HTML file '{html_file_path or 'unknown'}' not found")
@@ -1135,29 +1556,30 @@ if __name__ == "__main__":
             print(f"Error reading HTML file: {e}")
             sys.exit(1)
     else:
-        # URL analysis
-        target_url = sys.argv[1]
+        # URL analysis; several URLs share one event loop and browser
+        target_urls = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
 
-        print(f"Analyzing URL: {target_url}")
+        print(f"Analyzing URL(s): {', '.join(target_urls)}")
         print(f"Headless mode: {headless_mode}")
         print("-" * 50)
 
-        result = run_analysis(target_url, headless=headless_mode)
-
-    print("\n" + "=" * 50)
-    print("ANALYSIS RESULTS")
-    print("=" * 50)
-    print(f"Source: {result['source']}")
-    if result.get('url'):
-        print(f"URL: {result['url']}")
-    if result.get('html_length'):
-        print(f"HTML content length: {result['html_length']} characters")
-    print(f"Total fields found: {result['field_count']}")
-    print(f"Screenshot saved to: {result['screenshot_path']}")
-    print("\nField Summary:")
-    for field_type, count in result['field_summary'].items():
-        print(f"  - {field_type}: {count}")
-
-    print("\nDetailed Fields:")
-    for i, field_info in enumerate(result['fields'], 1):
-        print(f"  {i}. [{field_info['field_type']}] {field_info['label'] or field_info['name'] or field_info['placeholder'] or 'Unnamed'}")
+        results = [run_analysis(target_url, headless=headless_mode) for target_url in target_urls]
+
+    for result in results:
+        print("\n" + "=" * 50)
+        print("ANALYSIS RESULTS")
+        print("=" * 50)
+        print(f"Source: {result['source']}")
+        if result.get('url'):
+            print(f"URL: {result['url']}")
+        if result.get('html_length'):
+            print(f"HTML content length: {result['html_length']} characters")
+        print(f"Total fields found: {result['field_count']}")
+        print(f"Screenshot saved to: {result['screenshot_path']}")
+        print("\nField Summary:")
+        for field_type, count in result['field_summary'].items():
+            print(f"  - {field_type}: {count}")
+
+        print("\nDetailed Fields:")
+        for i, field_info in enumerate(result['fields'], 1):
+            print(f"  {i}. [{field_info['field_type']}] {field_info['label'] or field_info['name'] or field_info['placeholder'] or 'Unnamed'}")
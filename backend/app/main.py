@@ -3,12 +3,15 @@ from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import os
 import asyncio
+from typing import Optional
 
 # Load environment variables from .env file
 load_dotenv()
 
 from app.routers import health, screen_control, fields, scraper
-from app.dbmanager import db
+from app.dbmanager import db, close_client_pool
+from app.divselection import start_shared_browser, close_shared_browsers
+from app.agents.tools.screen_control_tools import close_async_client
 from app.agents.async_form_filler_agent import AsyncFormFillerAgent
 
 # Try to import form_filler, but make it optional
@@ -40,7 +43,13 @@ except ImportError as e:
 
 # Queue processor settings
 QUEUE_POLL_INTERVAL = 5  # seconds between polls
+# Number of concurrent queue workers. The form filler drives the real mouse and
+# keyboard, so keep this at 1 unless each worker has its own display.
+QUEUE_CONCURRENCY = max(1, int(os.getenv("QUEUE_CONCURRENCY", "1")))
 queue_processor_running = False
+# Set by the Firestore listener when pending queue items change, so idle
+# workers wake immediately instead of waiting out the poll interval
+queue_wakeup: Optional[asyncio.Event] = None
 
 
 async def process_queue_item(queue_item: dict) -> bool:
@@ -48,7 +57,8 @@ async def process_queue_item(queue_item: dict) -> bool:
     Process a single queue item.
 
     Args:
-        queue_item: Dictionary containing application_id, applicant_id, and _doc_id
+        queue_item: Claimed queue item (already marked 'processing') containing
+                    application_id, applicant_id, and _doc_id
 
     Returns:
         True if processed successfully, False otherwise
@@ -60,9 +70,6 @@ async def process_queue_item(queue_item: dict) -> bool:
     print(f"[QueueProcessor] Processing: application_id={application_id}, applicant_id={applicant_id}")
 
     try:
-        # Mark as processing
-        await db.update_queue_item_status(doc_id, 'processing')
-
         # Get user data
         user_data = await db.get_user_data(applicant_id)
         if not user_data:
@@ -105,36 +112,66 @@ async def process_queue_item(queue_item: dict) -> bool:
         return False
 
 
-async def queue_processor():
+async def queue_worker(worker_id: int):
     """
-    Background task that continuously polls the queue collection
-    and processes the oldest item.
-    """
-    global queue_processor_running
-    queue_processor_running = True
+    Claim and process queue items until the processor stops.
 
-    print("[QueueProcessor] Starting queue processor...")
+    Args:
+        worker_id: Index of this worker, used for logging and to stagger polls
+    """
+    # Stagger the first poll so workers don't all hit the database on the same tick
+    await asyncio.sleep(worker_id * QUEUE_POLL_INTERVAL / QUEUE_CONCURRENCY)
 
     while queue_processor_running:
+        # Cleared before claiming so an insert that lands after an empty claim
+        # still wakes us below
+        queue_wakeup.clear()
         try:
-            # Get the oldest queue item
-            queue_item = await db.get_oldest_queue_item()
+            # Claim the oldest pending item; the claim marks it 'processing'
+            # atomically so no other worker can pick it up
+            queue_item = await db.claim_oldest_queue_item()
 
             if queue_item:
-                # Check if it's already being processed
-                status = queue_item.get('status')
-                if status in ['processing', 'completed', 'failed']:
-                    print(f"[QueueProcessor] Skipping item with status: {status}")
-                else:
-                    await process_queue_item(queue_item)
-            else:
-                print("[QueueProcessor] Queue is empty, waiting...")
+                await process_queue_item(queue_item)
+                # Drain the backlog without pausing between items
+                continue
+
+            print(f"[QueueProcessor:{worker_id}] Queue is empty, waiting...")
 
         except Exception as e:
-            print(f"[QueueProcessor] Error in queue processor: {e}")
+            print(f"[QueueProcessor:{worker_id}] Error in queue processor: {e}")
+            await asyncio.sleep(QUEUE_POLL_INTERVAL)
+            continue
+
+        # Wait for the listener to report new items, polling as a fallback
+        try:
+            await asyncio.wait_for(queue_wakeup.wait(), timeout=QUEUE_POLL_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
 
-        # Wait before next poll
-        await asyncio.sleep(QUEUE_POLL_INTERVAL)
+
+async def queue_processor():
+    """
+    Background task that runs QUEUE_CONCURRENCY workers, each processing the
+    oldest queue item. Workers are woken by a Firestore listener on pending
+    items and fall back to polling every QUEUE_POLL_INTERVAL seconds.
+    """
+    global queue_processor_running, queue_wakeup
+    queue_processor_running = True
+    queue_wakeup = asyncio.Event()
+
+    print(f"[QueueProcessor] Starting queue processor with {QUEUE_CONCURRENCY} worker(s)...")
+
+    loop = asyncio.get_running_loop()
+    listener = db.watch_pending_queue(lambda: loop.call_soon_threadsafe(queue_wakeup.set))
+    if listener is None:
+        print("[QueueProcessor] Queue listener unavailable, falling back to polling")
+
+    try:
+        await asyncio.gather(*[queue_worker(i) for i in range(QUEUE_CONCURRENCY)])
+    finally:
+        if listener is not None:
+            listener.unsubscribe()
 
     print("[QueueProcessor] Queue processor stopped.")
 
@@ -142,6 +179,13 @@ async def queue_processor():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
+    # Startup: Warm the shared headless browser so the first job skips Chromium launch
+    try:
+        await start_shared_browser(headless=True)
+        print("[Lifespan] Shared browser started")
+    except Exception as e:
+        print(f"[Lifespan] Could not pre-launch shared browser: {e}")
+
     # Startup: Start the queue processor
     task = asyncio.create_task(queue_processor())
     print("[Lifespan] Queue processor task created")
@@ -157,6 +201,15 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         print("[Lifespan] Queue processor task cancelled")
 
+    # Shutdown: Close the shared Playwright browsers
+    await close_shared_browsers()
+
+    # Shutdown: Close the screen control tools' pooled HTTP connections
+    await close_async_client()
+
+    # Shutdown: Close this loop's Firestore client pool
+    await close_client_pool()
+
 
 app = FastAPI(
     title="DF26 Backend",
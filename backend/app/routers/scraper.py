@@ -2,11 +2,13 @@ import time
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from jobspy import scrape_jobs
 from ..schemas.job_app import JobApplication
 from ..schemas.job_app import JobCategory
-from ..dbmanager import DatabaseManager
+from ..dbmanager import db, InvalidCursorError
 
 router = APIRouter(prefix="/scraper", tags=["scraper"])
 
@@ -179,13 +181,57 @@ def _jobs_are_different(existing_job: JobApplication, new_job: JobApplication) -
 
     return False
 
+def _validate_job_query(limit: int, offset: int, order_direction: str, category: Optional[str]) -> None:
+    """Raise a 400 HTTPException for invalid /get-jobs query parameters."""
+    # Validate category if provided
+    valid_categories = [c.value for c in JobCategory]
+    if category and category not in valid_categories:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid category '{category}'. Valid categories: {valid_categories}"
+        )
+
+    # Validate parameters
+    if limit <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Limit must be greater than 0"
+        )
+
+    if offset < 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Offset must be 0 or greater"
+        )
+
+    if order_direction.lower() not in ["asc", "desc"]:
+        raise HTTPException(
+            status_code=400,
+            detail="Order direction must be 'asc' or 'desc'"
+        )
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for Firestore's datetime subclass (DatetimeWithNanoseconds)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[list]:
+    """Split a comma-separated fields query parameter into a list (None for all fields)."""
+    return [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+
 @router.get("/get-jobs")
 async def get_jobs_endpoint(
     limit: int = 10,
     offset: int = 0,
     order_by: str = "date_posted",
     order_direction: str = "desc",
-    category: Optional[str] = None
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Fetch n jobs starting at a certain index from the Firestore database.
@@ -196,48 +242,27 @@ async def get_jobs_endpoint(
         order_by: Field to order by - default: "date_posted"
         order_direction: Order direction ("asc" or "desc") - default: "desc"
         category: Optional JobCategory value to filter by (e.g. "software_engineering", "finance")
+        cursor: Optional next_cursor from the previous response; pages after it
+                without Firestore re-reading the skipped documents
+        fields: Optional comma-separated job fields to return (e.g.
+                "application_id,position_title,company_name,date_posted,job_url,category");
+                defaults to full job records
 
     Returns:
         Dictionary containing jobs list and pagination metadata
     """
     try:
-        # Validate category if provided
-        valid_categories = [c.value for c in JobCategory]
-        if category and category not in valid_categories:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid category '{category}'. Valid categories: {valid_categories}"
-            )
-
-        # Validate parameters
-        if limit <= 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Limit must be greater than 0"
-            )
+        _validate_job_query(limit, offset, order_direction, category)
 
-        if offset < 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Offset must be 0 or greater"
-            )
-
-        if order_direction.lower() not in ["asc", "desc"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Order direction must be 'asc' or 'desc'"
-            )
-
-        # Create database manager instance
-        db_manager = DatabaseManager()
-
-        # Fetch jobs with pagination
-        result = await db_manager.get_jobs_paginated(
+        # Fetch jobs with pagination (shared process-wide DatabaseManager)
+        result = await db.get_jobs_paginated(
             limit=limit,
             offset=offset,
             order_by=order_by,
             order_direction=order_direction,
-            category=category
+            category=category,
+            cursor=cursor,
+            fields=_parse_fields(fields)
         )
 
         # Check if there was an error in the database operation
@@ -253,6 +278,8 @@ async def get_jobs_endpoint(
             "message": f"Successfully fetched {len(result['jobs'])} jobs (offset: {offset}, limit: {limit})"
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
@@ -263,6 +290,66 @@ async def get_jobs_endpoint(
         )
 
 
+@router.get("/get-jobs/stream")
+async def stream_jobs_endpoint(
+    limit: int = 10,
+    offset: int = 0,
+    order_by: str = "date_posted",
+    order_direction: str = "desc",
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Stream one page of jobs as newline-delimited JSON, one job per line.
+
+    Rows are sent as soon as Firestore returns them instead of after the whole
+    page is built. Takes the same parameters as /get-jobs; no pagination
+    metadata is included (use the last job's application_id, which is always
+    returned even when `fields` omits it, as the cursor).
+
+    The cursor and the first row are resolved before the response starts, so
+    a bad cursor is a 400. If the stream fails after that, a final
+    {"error": message} line marks the page as truncated.
+
+    Returns:
+        application/x-ndjson stream of job dictionaries
+    """
+    _validate_job_query(limit, offset, order_direction, category)
+    jobs = db.iter_jobs(
+        limit=limit,
+        offset=offset,
+        order_by=order_by,
+        order_direction=order_direction,
+        category=category,
+        cursor=cursor,
+        fields=_parse_fields(fields)
+    )
+
+    # Pull the first row while the status code can still change
+    try:
+        first_job = await anext(jobs, None)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching jobs: {str(e)}")
+
+    async def ndjson():
+        if first_job is None:
+            return
+        yield orjson.dumps(first_job, default=_json_default) + b"\n"
+        try:
+            async for job in jobs:
+                yield orjson.dumps(job, default=_json_default) + b"\n"
+        except Exception as e:
+            # Headers are already sent; end with an error line so clients can
+            # tell a truncated page from a complete one
+            print(f"Error streaming jobs: {e}")
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/scrape-jobs")
 async def scrape_jobs_endpoint(
     site_name: str = "indeed,linkedin,zip_recruiter,google",
@@ -320,7 +407,6 @@ async def scrape_jobs_endpoint(
         # Parse site_name parameter into a list
         sites = [site.strip() for site in site_name.split(",")]
 
-        db_manager = DatabaseManager()
         job_applications = []
         saved_count = 0
         updated_count = 0
@@ -365,6 +451,10 @@ async def scrape_jobs_endpoint(
             total_scraped += len(jobs)
             new_in_this_batch = 0
 
+            # Look up every scraped ID in one batched read instead of one RPC per job
+            scraped_ids = [str(i) for i in jobs['id'] if i] if 'id' in jobs.columns else []
+            known_jobs = await db.get_job_applications(scraped_ids) if scraped_ids else {}
+
             for _, job_row in jobs.iterrows():
                 try:
                     parsed_date = _parse_date_posted(job_row.get('date_posted'))
@@ -413,13 +503,13 @@ async def scrape_jobs_endpoint(
                     # Check if job already exists by URL or ID
                     existing_job = None
                     if job_application.job_url:
-                        existing_job = await db_manager.get_job_by_url(job_application.job_url)
+                        existing_job = await db.get_job_by_url(job_application.job_url)
                     if not existing_job and job_application.application_id:
-                        existing_job = await db_manager.get_job_application(job_application.application_id)
+                        existing_job = known_jobs.get(job_application.application_id)
 
                     if existing_job:
                         if _jobs_are_different(existing_job, job_application):
-                            if await db_manager.update_job_application(existing_job.application_id, job_application):
+                            if await db.update_job_application(existing_job.application_id, job_application):
                                 updated_count += 1
                                 job_applications.append(job_application.model_dump())
                                 print(f"Updated job: {job_application.position_title} at {job_application.company_name}")
@@ -427,7 +517,8 @@ async def scrape_jobs_endpoint(
                             skipped_count += 1
                             print(f"Skipped unchanged job: {job_application.position_title} at {job_application.company_name}")
                     else:
-                        if await db_manager.create_job_application(job_application):
+                        if await db.create_job_application(job_application):
+                            known_jobs[job_application.application_id] = job_application
                             saved_count += 1
                             new_in_this_batch += 1
                             job_applications.append(job_application.model_dump())
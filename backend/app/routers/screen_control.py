@@ -10,15 +10,18 @@ These endpoints allow an agent to:
 - Scroll the screen
 - Take screenshots
 - Press keyboard keys
+- Fill form fields and select dropdown options in a single request
 
 WARNING: These endpoints provide full control over the user's screen.
 Use with extreme caution and proper authentication.
 """
 import io
 import base64
+import platform
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 import pyautogui
 
 from app.schemas.screen_control import (
@@ -27,6 +30,8 @@ from app.schemas.screen_control import (
     MouseDragRequest,
     MouseScrollRequest,
     KeyPressRequest,
+    FillFieldRequest,
+    SelectOptionRequest,
     ScreenInfoResponse,
 )
 
@@ -36,6 +41,47 @@ router = APIRouter(prefix="/screen-control", tags=["screen-control"])
 pyautogui.FAILSAFE = False
 pyautogui.PAUSE = 0.1  # Small pause between actions
 
+# Modifier used for select-all when a fill explicitly asks to clear the field
+_MODIFIER_KEY = "command" if platform.system() == "Darwin" else "ctrl"
+
+
+def _parse_region(region: Optional[str]) -> Optional[tuple[int, int, int, int]]:
+    """Parse an "x,y,width,height" region string"""
+    if not region:
+        return None
+    parts = region.split(",")
+    if len(parts) != 4:
+        raise HTTPException(
+            status_code=400,
+            detail="Region must be in format 'x,y,width,height'"
+        )
+    x, y, width, height = map(int, parts)
+    return (x, y, width, height)
+
+
+def _capture_image(region: Optional[tuple[int, int, int, int]], format: str) -> bytes:
+    """Capture the screen and encode it (CPU-bound, run off the event loop)"""
+    screenshot = pyautogui.screenshot(region=region) if region else pyautogui.screenshot()
+    img_io = io.BytesIO()
+    screenshot.save(img_io, format=format.upper())
+    return img_io.getvalue()
+
+
+def _fill_field_macro(request: FillFieldRequest) -> None:
+    """Click a field, optionally clear it, and type (blocking, run off the event loop)"""
+    pyautogui.click(request.x, request.y, button="left", clicks=1)
+    if request.clear:
+        pyautogui.hotkey(_MODIFIER_KEY, "a")
+        pyautogui.press("delete")
+    pyautogui.write(request.text, interval=request.interval or 0.0)
+
+
+def _select_option_macro(request: SelectOptionRequest) -> None:
+    """Open a dropdown, type the option and press enter (blocking, run off the event loop)"""
+    pyautogui.click(request.x, request.y, button="left", clicks=1)
+    pyautogui.write(request.option)
+    pyautogui.press("enter")
+
 
 @router.get("/info", response_model=ScreenInfoResponse)
 async def get_screen_info() -> ScreenInfoResponse:
@@ -271,6 +317,72 @@ async def type_text(text: str, interval: Optional[float] = None) -> dict[str, st
         raise HTTPException(status_code=500, detail=f"Failed to type text: {str(e)}")
 
 
+@router.post("/form/fill_field")
+async def fill_field(request: FillFieldRequest) -> dict[str, str]:
+    """
+    Click a field, optionally clear its contents, and type text.
+    
+    Runs the whole click → (select all → delete) → type macro server-side so
+    clients pay a single round-trip per field. The macro runs in the
+    threadpool so typing a long value does not block the event loop.
+    
+    Args:
+        request: FillFieldRequest with field center, text and clear flag
+        
+    Returns:
+        Success message
+    """
+    try:
+        screen_width, screen_height = pyautogui.size()
+        if request.x < 0 or request.x >= screen_width or request.y < 0 or request.y >= screen_height:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Coordinates ({request.x}, {request.y}) are out of bounds"
+            )
+        
+        await run_in_threadpool(_fill_field_macro, request)
+        
+        return {
+            "status": "success",
+            "message": f"Filled field at ({request.x}, {request.y})"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fill field: {str(e)}")
+
+
+@router.post("/form/select")
+async def select_option(request: SelectOptionRequest) -> dict[str, str]:
+    """
+    Open a dropdown, type the option text and press enter to select it.
+    
+    Args:
+        request: SelectOptionRequest with dropdown center and option text
+        
+    Returns:
+        Success message
+    """
+    try:
+        screen_width, screen_height = pyautogui.size()
+        if request.x < 0 or request.x >= screen_width or request.y < 0 or request.y >= screen_height:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Coordinates ({request.x}, {request.y}) are out of bounds"
+            )
+        
+        await run_in_threadpool(_select_option_macro, request)
+        
+        return {
+            "status": "success",
+            "message": f"Selected '{request.option}' at ({request.x}, {request.y})"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to select option: {str(e)}")
+
+
 @router.get("/screenshot")
 async def take_screenshot(
     region: Optional[str] = None,
@@ -287,25 +399,10 @@ async def take_screenshot(
         Image file as response
     """
     try:
-        if region:
-            parts = region.split(",")
-            if len(parts) != 4:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Region must be in format 'x,y,width,height'"
-                )
-            x, y, width, height = map(int, parts)
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        else:
-            screenshot = pyautogui.screenshot()
-        
-        # Convert to bytes
-        img_io = io.BytesIO()
-        screenshot.save(img_io, format=format.upper())
-        img_io.seek(0)
+        image_bytes = await run_in_threadpool(_capture_image, _parse_region(region), format)
         
         return StreamingResponse(
-            io.BytesIO(img_io.read()),
+            io.BytesIO(image_bytes),
             media_type=f"image/{format.lower()}",
             headers={"Content-Disposition": "attachment; filename=screenshot.png"}
         )
@@ -315,6 +412,31 @@ async def take_screenshot(
         raise HTTPException(status_code=500, detail=f"Failed to take screenshot: {str(e)}")
 
 
+@router.get("/screenshot/binary")
+async def take_screenshot_binary(
+    region: Optional[str] = None
+) -> Response:
+    """
+    Take a screenshot and return the raw PNG bytes with a Content-Length header.
+    
+    Cheaper than /screenshot/base64: no base64 inflation on the wire and no
+    JSON wrapping for the client to parse.
+    
+    Args:
+        region: Optional region in format "x,y,width,height"
+        
+    Returns:
+        PNG image bytes
+    """
+    try:
+        png_bytes = await run_in_threadpool(_capture_image, _parse_region(region), "png")
+        return Response(content=png_bytes, media_type="image/png")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to take screenshot: {str(e)}")
+
+
 @router.get("/screenshot/base64")
 async def take_screenshot_base64(
     region: Optional[str] = None
@@ -329,23 +451,8 @@ async def take_screenshot_base64(
         Base64-encoded image string
     """
     try:
-        if region:
-            parts = region.split(",")
-            if len(parts) != 4:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Region must be in format 'x,y,width,height'"
-                )
-            x, y, width, height = map(int, parts)
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        else:
-            screenshot = pyautogui.screenshot()
-        
-        # Convert to base64
-        img_io = io.BytesIO()
-        screenshot.save(img_io, format="PNG")
-        img_io.seek(0)
-        img_base64 = base64.b64encode(img_io.read()).decode("utf-8")
+        png_bytes = await run_in_threadpool(_capture_image, _parse_region(region), "png")
+        img_base64 = base64.b64encode(png_bytes).decode("utf-8")
         
         return {
             "status": "success",
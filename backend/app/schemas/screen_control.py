@@ -63,6 +63,29 @@ class KeyPressRequest(BaseModel):
     )
 
 
+class FillFieldRequest(BaseModel):
+    """Request to click a field, optionally clear it, and type text in one call"""
+    x: int = Field(..., description="X coordinate of the field center")
+    y: int = Field(..., description="Y coordinate of the field center")
+    text: str = Field(..., description="Text to type into the field")
+    clear: bool = Field(
+        default=False,
+        description="Select all and delete existing text before typing. Off by default since "
+                    "the form-filling agents treat select-all and delete as disabled keys"
+    )
+    interval: Optional[float] = Field(
+        default=None,
+        description="Interval between keystrokes in seconds"
+    )
+
+
+class SelectOptionRequest(BaseModel):
+    """Request to open a dropdown, type an option and confirm it with enter"""
+    x: int = Field(..., description="X coordinate of the dropdown center")
+    y: int = Field(..., description="Y coordinate of the dropdown center")
+    option: str = Field(..., description="Option text to type")
+
+
 class ScreenInfoResponse(BaseModel):
     """Response containing screen information"""
     width: int = Field(..., description="Screen width in pixels")
@@ -27,5 +27,6 @@ echo ""
 echo "Press Ctrl+C to stop"
 echo ""
 
-uvicorn app.main:app --host $HOST --port $PORT --reload
+# Keep idle connections open long enough for agent tools to reuse them
+uvicorn app.main:app --host $HOST --port $PORT --reload --timeout-keep-alive 60
 
@@ -0,0 +1,43 @@
+"""
+Unit tests for the async screen control tool helpers (key events are recorded, not sent)
+
+Usage:
+    python -m pytest tests
+"""
+import platform
+
+import pytest
+
+
+@pytest.fixture
+def tools():
+    pytest.importorskip("pyautogui")
+    pytest.importorskip("langchain_core")
+    from app.agents.tools import async_screen_control_tools
+    return async_screen_control_tools
+
+
+@pytest.fixture
+def key_events(tools, monkeypatch):
+    events = []
+    monkeypatch.setattr(tools.pyautogui, "keyDown", lambda key, _pause=True: events.append(("down", key, _pause)))
+    monkeypatch.setattr(tools.pyautogui, "keyUp", lambda key, _pause=True: events.append(("up", key, _pause)))
+    return events
+
+
+def test_hotkey_presses_in_order_and_releases_in_reverse(tools, key_events):
+    tools._hotkey_fast("ctrl", "shift", "v")
+
+    assert key_events == [
+        ("down", "ctrl", False),
+        ("down", "shift", False),
+        ("down", "v", False),
+        ("up", "v", False),
+        ("up", "shift", False),
+        ("up", "ctrl", False),
+    ]
+
+
+def test_modifier_key_matches_platform(tools):
+    expected = "command" if platform.system() == "Darwin" else "ctrl"
+    assert tools._MODIFIER_KEY == expected
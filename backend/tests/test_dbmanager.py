@@ -0,0 +1,132 @@
+"""
+Unit tests for DatabaseManager pagination (Firestore is replaced by fakes)
+
+Usage:
+    python -m pytest tests
+"""
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("firebase_admin")
+pytest.importorskip("google.cloud.firestore")
+
+# Importing dbmanager builds the module-level manager; give it a stand-in
+# Firebase app so no credentials file is needed
+with mock.patch("firebase_admin.get_app", return_value=mock.Mock()):
+    from app.dbmanager import DatabaseManager, InvalidCursorError
+
+
+def _manager(doc_ids, total_count):
+    """A manager whose jobs query yields doc_ids and whose count is cached."""
+    with mock.patch("firebase_admin.get_app", return_value=mock.Mock()):
+        manager = DatabaseManager()
+    manager._count_cache[None] = (time.monotonic(), total_count)
+    manager.stream_calls = []
+
+    async def stream_jobs(limit, offset, order_by, order_direction, category, cursor, fields):
+        manager.stream_calls.append((limit, offset, cursor))
+        for doc_id in doc_ids[:limit]:
+            yield doc_id, {"application_id": doc_id}
+
+    manager._stream_jobs = stream_jobs
+    return manager
+
+
+def test_page_with_more_results():
+    manager = _manager(["a", "b", "c"], total_count=3)
+
+    result = asyncio.run(manager.get_jobs_paginated(limit=2))
+
+    assert manager.stream_calls == [(3, 0, None)]
+    assert [job["application_id"] for job in result["jobs"]] == ["a", "b"]
+    assert result["next_cursor"] == "b"
+    assert result["has_next"] is True
+    assert result["current_page"] == 1
+    assert result["total_pages"] == 2
+
+
+def test_last_page_has_no_cursor():
+    manager = _manager(["a", "b"], total_count=2)
+
+    result = asyncio.run(manager.get_jobs_paginated(limit=2))
+
+    assert len(result["jobs"]) == 2
+    assert result["next_cursor"] is None
+    assert result["has_next"] is False
+
+
+def test_cursor_page_has_no_position():
+    manager = _manager(["c", "d", "e"], total_count=10)
+
+    result = asyncio.run(manager.get_jobs_paginated(limit=2, offset=4, cursor="b"))
+
+    assert manager.stream_calls == [(3, 4, "b")]
+    assert result["next_cursor"] == "d"
+    assert result["has_next"] is True
+    assert result["has_previous"] is True
+    assert result["current_page"] is None
+    assert result["total_pages"] is None
+
+
+def test_invalid_cursor_is_raised():
+    manager = _manager([], total_count=0)
+
+    async def failing_stream(*args):
+        raise InvalidCursorError("Invalid cursor: missing")
+        yield
+
+    manager._stream_jobs = failing_stream
+    with pytest.raises(InvalidCursorError):
+        asyncio.run(manager.get_jobs_paginated(limit=2, cursor="missing"))
+
+
+def test_database_errors_are_reported():
+    manager = _manager([], total_count=0)
+
+    async def failing_stream(*args):
+        raise RuntimeError("unavailable")
+        yield
+
+    manager._stream_jobs = failing_stream
+    result = asyncio.run(manager.get_jobs_paginated(limit=2))
+
+    assert result["jobs"] == []
+    assert result["next_cursor"] is None
+    assert result["error"] == "unavailable"
+
+
+class _FakeDoc:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+def test_user_data_bulk_reads_only_uncached_users():
+    manager = _manager([], total_count=0)
+    manager._cache_user("cached", {"name": "Cached"})
+    stored = {"fresh": {"name": "Fresh"}}
+    requested_refs = []
+
+    async def get_all(refs):
+        requested_refs.extend(refs)
+        for ref in refs:
+            yield _FakeDoc(ref.id, stored.get(ref.id))
+
+    client = mock.Mock()
+    client.collection.return_value.document.side_effect = lambda doc_id: mock.Mock(id=doc_id)
+    client.get_all = get_all
+
+    with mock.patch.object(DatabaseManager, "db", new_callable=mock.PropertyMock, return_value=client):
+        users = asyncio.run(manager.get_user_data_bulk(["cached", "fresh", "missing", "fresh"]))
+
+    assert users == {"cached": {"name": "Cached"}, "fresh": {"name": "Fresh"}}
+    assert [ref.id for ref in requested_refs] == ["fresh", "missing"]
+    # Fetched users are served from the cache afterwards
+    assert manager._get_cached_user("fresh") == {"name": "Fresh"}
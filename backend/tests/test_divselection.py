@@ -0,0 +1,114 @@
+"""
+Unit tests for the pure helpers in app.divselection (no browser is launched)
+
+Usage:
+    python -m pytest tests
+"""
+import os
+import time
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from app import divselection
+from app.divselection import DivSelector, FieldType, SubmissionStatus
+
+
+@pytest.mark.parametrize("input_type, name, expected", [
+    ("text", "first_name", FieldType.NAME),
+    ("text", "applicant_email", FieldType.EMAIL),
+    ("text", "mobile", FieldType.PHONE),
+    ("text", "resume", FieldType.FILE),
+    ("text", "linkedin_url", FieldType.URL),
+    ("text", "start_date", FieldType.DATE),
+    ("text", "company", FieldType.TEXT),
+    ("", "company", FieldType.UNKNOWN),
+    # The input type wins over keywords in the attributes
+    ("email", "phone", FieldType.EMAIL),
+    ("checkbox", "first_name", FieldType.CHECKBOX),
+    # Rules are checked in FIELD_KEYWORDS order: name before email
+    ("text", "last_email", FieldType.NAME),
+])
+def test_classify_field(input_type, name, expected):
+    assert divselection._classify_cached(input_type, name, "", "", "", "") is expected
+
+
+def test_classify_field_matches_case_insensitively():
+    assert divselection._classify_cached("text", "", "", "Your E-Mail", "", "") is FieldType.EMAIL
+
+
+@pytest.mark.parametrize("searchable, expected", [
+    ("Submit application", FieldType.SUBMIT),
+    ("next step", FieldType.SUBMIT),
+    ("Cancel", FieldType.BUTTON),
+])
+def test_classify_button(searchable, expected):
+    assert divselection._classify_button_cached(searchable) is expected
+
+
+@pytest.mark.parametrize("counts, url_indicators, expected_status, expected_confidence", [
+    ((2, 0, 0), [], SubmissionStatus.SUBMITTED, 0.9),
+    ((0, 2, 0), [], SubmissionStatus.ERROR, 0.8),
+    ((0, 0, 2), [], SubmissionStatus.PENDING, 0.7),
+    ((1, 1, 0), [], SubmissionStatus.SUBMITTED, 0.6),
+    ((0, 1, 0), [], SubmissionStatus.ERROR, 0.6),
+    ((0, 0, 1), [], SubmissionStatus.PENDING, 0.4),
+    ((0, 0, 0), ["confirmation"], SubmissionStatus.SUBMITTED, 0.65),
+    ((0, 0, 0), [], SubmissionStatus.NOT_SUBMITTED, 0.3),
+])
+def test_determine_status(tmp_path, counts, url_indicators, expected_status, expected_confidence):
+    selector = DivSelector(screenshot_dir=str(tmp_path))
+    n_success, n_error, n_pending = counts
+
+    status, confidence = selector._determine_status(
+        n_success=n_success, n_error=n_error, n_pending=n_pending, url_indicators=url_indicators
+    )
+
+    assert status is expected_status
+    assert confidence == pytest.approx(expected_confidence)
+
+
+def _cacheable_result(tmp_path) -> dict:
+    screenshot = tmp_path / "shot.png"
+    screenshot.write_bytes(b"")
+    return {"url": "https://jobs.example.com/apply", "screenshot_path": str(screenshot), "fields": []}
+
+
+def test_analysis_cache_round_trip(tmp_path):
+    result = _cacheable_result(tmp_path)
+    divselection._write_cached_analysis(result["url"], True, tmp_path, result)
+
+    assert divselection._read_cached_analysis(result["url"], True, tmp_path) == result
+    # headless is part of the key
+    assert divselection._read_cached_analysis(result["url"], False, tmp_path) is None
+
+
+def test_analysis_cache_expires(tmp_path):
+    result = _cacheable_result(tmp_path)
+    divselection._write_cached_analysis(result["url"], True, tmp_path, result)
+    path = divselection._analysis_cache_path(result["url"], True, tmp_path)
+    stale = time.time() - divselection._ANALYSIS_CACHE_TTL - 1
+    os.utime(path, (stale, stale))
+
+    assert divselection._read_cached_analysis(result["url"], True, tmp_path) is None
+
+
+def test_analysis_cache_misses_without_screenshot(tmp_path):
+    result = _cacheable_result(tmp_path)
+    divselection._write_cached_analysis(result["url"], True, tmp_path, result)
+    os.remove(result["screenshot_path"])
+
+    assert divselection._read_cached_analysis(result["url"], True, tmp_path) is None
+
+
+def test_analysis_cache_is_capped(tmp_path, monkeypatch):
+    monkeypatch.setattr(divselection, "_ANALYSIS_CACHE_MAX_FILES", 2)
+    result = _cacheable_result(tmp_path)
+    for i in range(4):
+        url = f"https://jobs.example.com/apply/{i}"
+        divselection._write_cached_analysis(url, True, tmp_path, {**result, "url": url})
+        path = divselection._analysis_cache_path(url, True, tmp_path)
+        os.utime(path, (time.time() - 10 + i, time.time() - 10 + i))
+
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 2
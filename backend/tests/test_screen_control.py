@@ -0,0 +1,32 @@
+"""
+Unit tests for the screen control router helpers (no display needed)
+
+Usage:
+    python -m pytest tests
+"""
+import pytest
+
+
+class TestParseRegion:
+    @pytest.fixture(autouse=True)
+    def router(self):
+        pytest.importorskip("fastapi")
+        pytest.importorskip("pyautogui")
+        from fastapi import HTTPException
+        from app.routers import screen_control
+
+        self.parse_region = screen_control._parse_region
+        self.http_exception = HTTPException
+
+    @pytest.mark.parametrize("region", [None, ""])
+    def test_no_region(self, region):
+        assert self.parse_region(region) is None
+
+    def test_region(self):
+        assert self.parse_region("10,20,300,400") == (10, 20, 300, 400)
+
+    @pytest.mark.parametrize("region", ["10,20,300", "1,2,3,4,5"])
+    def test_wrong_number_of_parts(self, region):
+        with pytest.raises(self.http_exception) as exc_info:
+            self.parse_region(region)
+        assert exc_info.value.status_code == 400
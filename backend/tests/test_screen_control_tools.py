@@ -0,0 +1,37 @@
+"""
+Unit tests for the HTTP screen control tool helpers (no running server needed)
+
+Usage:
+    python -m pytest tests
+"""
+import pytest
+
+
+class TestCheckBounds:
+    @pytest.fixture(autouse=True)
+    def tools(self, monkeypatch):
+        pytest.importorskip("httpx")
+        pytest.importorskip("langchain_core")
+        from app.agents.tools import screen_control_tools
+
+        self.base = screen_control_tools.ScreenControlToolBase
+        self.screen_info = screen_control_tools.GetScreenInfoTool
+        monkeypatch.setattr(self.screen_info, "_cached_width", None)
+        monkeypatch.setattr(self.screen_info, "_cached_height", None)
+
+    def test_unknown_screen_size_defers_to_server(self):
+        assert self.base._check_bounds(-5, 100000) is None
+
+    @pytest.mark.parametrize("x, y", [(0, 0), (1919, 1079), (960, 540)])
+    def test_inside_screen(self, monkeypatch, x, y):
+        monkeypatch.setattr(self.screen_info, "_cached_width", 1920)
+        monkeypatch.setattr(self.screen_info, "_cached_height", 1080)
+        assert self.base._check_bounds(x, y) is None
+
+    @pytest.mark.parametrize("x, y", [(-1, 0), (0, -1), (1920, 0), (0, 1080)])
+    def test_outside_screen(self, monkeypatch, x, y):
+        monkeypatch.setattr(self.screen_info, "_cached_width", 1920)
+        monkeypatch.setattr(self.screen_info, "_cached_height", 1080)
+        error = self.base._check_bounds(x, y)
+        assert error.startswith("Error:")
+        assert "1920x1080" in error